@@ -0,0 +1,52 @@
+"""
+Compares chessdotcom.pgn.get_tags_batch with a naive regular expression
+reading every tag pair of the games. Run from the root of the repository:
+
+    python bin/benchmark_pgn_tags.py
+"""
+
+import json
+import re
+import sys
+import timeit
+
+import yaml
+
+sys.path.insert(0, ".")
+
+from chessdotcom.pgn import get_tags_batch  # noqa: E402
+
+CASSETTE = "tests/fixtures/vcr_cassettes/get_player_games_by_month.yaml"
+TAGS = ["Termination", "ECO", "ECOUrl", "TimeControl"]
+TAG_PAIR = re.compile(r'\[(\w+) "([^"]*)"\]')
+REPEAT = 20
+
+
+def naive_tags_batch(pgns, tags):
+    headers = [dict(TAG_PAIR.findall(pgn)) for pgn in pgns]
+    return {tag: [header.get(tag) for header in headers] for tag in tags}
+
+
+def load_pgns():
+    with open(CASSETTE) as file:
+        cassette = yaml.safe_load(file)
+
+    body = cassette["interactions"][0]["response"]["body"]["string"]
+    return [game["pgn"] for game in json.loads(body)["games"]]
+
+
+def main():
+    pgns = load_pgns() * 100
+    if get_tags_batch(pgns, TAGS) != naive_tags_batch(pgns, TAGS):
+        raise SystemExit("get_tags_batch and the naive regex read different tags")
+
+    for name, func in (
+        ("get_tags_batch", get_tags_batch),
+        ("naive regex", naive_tags_batch),
+    ):
+        seconds = min(timeit.repeat(lambda: func(pgns, TAGS), number=1, repeat=REPEAT))
+        print(f"{name:>15}: {seconds * 1000:8.2f} ms for {len(pgns)} games")
+
+
+if __name__ == "__main__":
+    main()
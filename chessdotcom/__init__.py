@@ -1,4 +1,11 @@
-from .client import ChessDotComClient, Client, RateLimitHandler
+from .cache import FileCache, MemoryCache, SQLiteCache
+from .client import (
+    ChessDotComClient,
+    Client,
+    ConnectionConfig,
+    RateLimiter,
+    RateLimitHandler,
+)
 from .endpoints import (
     get_club_details,
     get_club_matches,
@@ -29,8 +36,11 @@ from .endpoints import (
     get_tournament_details,
     get_tournament_round,
     get_tournament_round_group_details,
+    stream_player_games_by_month,
+    stream_player_games_by_month_pgn,
 )
 from .errors import ChessDotComClientError, ChessDotComError
 from .response_builder import ChessDotComResponse
+from .store import GameStore, sync_player
 
 __version__ = "3.13.0"
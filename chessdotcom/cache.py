@@ -0,0 +1,337 @@
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class CacheEntry(object):
+    """
+    Response body stored by a cache together with its validators.
+
+    :ivar content: Body of the cached response.
+    :ivar etag: Value of the response's 'ETag' header.
+    :ivar last_modified: Value of the response's 'Last-Modified' header.
+    :ivar expires_at: Epoch time until which the entry is served without asking the API.
+        ``math.inf`` if the entry never expires.
+    """
+
+    def __init__(self, content, etag=None, last_modified=None, expires_at=0) -> None:
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+
+    @classmethod
+    def from_response(cls, content, headers, ttl=0):
+        """
+        Returns a :obj:`CacheEntry` for a response,
+        or None if the response can neither be reused nor revalidated.
+
+        :param ttl: Number of seconds the entry is fresh for. Never expires if None.
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified and ttl == 0:
+            return None
+
+        entry = cls(content=content, etag=etag, last_modified=last_modified)
+        entry.refresh(ttl)
+        return entry
+
+    def refresh(self, ttl=0):
+        """
+        Marks the entry as fresh for another ``ttl`` seconds. Never expires if None.
+        """
+        self.expires_at = math.inf if ttl is None else time.time() + ttl
+
+    def is_fresh(self):
+        return time.time() < self.expires_at
+
+    def can_revalidate(self):
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self):
+        """
+        Returns the headers asking the API to answer with 304
+        if the resource has not changed since the entry was stored.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+
+class BaseCache(object):
+    """
+    Base class for response caches. Entries are keyed by the URL of the resource.
+
+    :ivar ttl: Number of seconds a response is served from the cache without asking the API.
+        0 means every cached response is revalidated with a conditional request.
+        None means responses never expire.
+    :ivar endpoint_ttls: Dictionary overriding ``ttl`` for single endpoints,
+        keyed by the name of the endpoint function, e.g. ``{"get_leaderboards": 300}``.
+    :ivar hits: Number of responses served from the cache,
+        including the ones revalidated with a 304 response.
+    :ivar misses: Number of responses downloaded from the API.
+    """
+
+    def __init__(self, ttl=0, endpoint_ttls=None) -> None:
+        self.ttl = ttl
+        self.endpoint_ttls = endpoint_ttls or {}
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    def get(self, key):
+        raise NotImplementedError("Method must be defined by the child class")
+
+    def set(self, key, entry):
+        raise NotImplementedError("Method must be defined by the child class")
+
+    def delete(self, key):
+        raise NotImplementedError("Method must be defined by the child class")
+
+    def clear(self):
+        raise NotImplementedError("Method must be defined by the child class")
+
+    def get_ttl(self, endpoint=None):
+        """
+        Returns the time to live of responses of the endpoint.
+        """
+        return self.endpoint_ttls.get(endpoint, self.ttl)
+
+    def record_hit(self):
+        with self._stats_lock:
+            self.hits += 1
+
+    def record_miss(self):
+        with self._stats_lock:
+            self.misses += 1
+
+
+class MemoryCache(BaseCache):
+    """
+    Cache holding the entries in memory of the current process.
+
+    :ivar max_size: Maximum number of entries. The least recently used entries
+        are evicted first. No limit if None.
+    """
+
+    def __init__(self, max_size=None, ttl=0, endpoint_ttls=None) -> None:
+        super().__init__(ttl=ttl, endpoint_ttls=endpoint_ttls)
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+            return entry
+
+    def set(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+
+            if self.max_size is not None:
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache(BaseCache):
+    """
+    Cache storing the entries in a SQLite database file.
+
+    :ivar path: Path of the database file. Created if it does not exist.
+    :ivar max_size: Maximum number of entries. The least recently used entries
+        are evicted first. No limit if None.
+    """
+
+    def __init__(self, path, max_size=None, ttl=0, endpoint_ttls=None) -> None:
+        super().__init__(ttl=ttl, endpoint_ttls=endpoint_ttls)
+        self.path = path
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, "
+                "content BLOB, "
+                "etag TEXT, "
+                "last_modified TEXT, "
+                "expires_at REAL, "
+                "accessed_at REAL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS entries_accessed_at "
+                "ON entries (accessed_at)"
+            )
+
+    def get(self, key):
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT content, etag, last_modified, expires_at "
+                "FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._connection.execute(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+
+        content, etag, last_modified, expires_at = row
+        return CacheEntry(
+            content=content,
+            etag=etag,
+            last_modified=last_modified,
+            expires_at=expires_at,
+        )
+
+    def set(self, key, entry):
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(key, content, etag, last_modified, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    entry.content,
+                    entry.etag,
+                    entry.last_modified,
+                    entry.expires_at,
+                    time.time(),
+                ),
+            )
+
+            if self.max_size is not None:
+                self._connection.execute(
+                    "DELETE FROM entries WHERE key NOT IN "
+                    "(SELECT key FROM entries ORDER BY accessed_at DESC LIMIT ?)",
+                    (self.max_size,),
+                )
+
+    def delete(self, key):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM entries")
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+class FileCache(BaseCache):
+    """
+    Cache storing every entry in its own file inside a directory.
+
+    :ivar directory: Path of the directory. Created if it does not exist.
+    :ivar max_size: Maximum number of entries. The least recently used entries
+        are evicted first. No limit if None.
+    """
+
+    def __init__(self, directory, max_size=None, ttl=0, endpoint_ttls=None) -> None:
+        super().__init__(ttl=ttl, endpoint_ttls=endpoint_ttls)
+        self.directory = directory
+        self.max_size = max_size
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+
+    def get(self, key):
+        path = self._path(key)
+        with self._lock:
+            try:
+                with open(path, "rb") as file:
+                    meta = json.loads(file.readline())
+                    content = file.read()
+            except FileNotFoundError:
+                return None
+
+            self._touch(path)
+
+        return CacheEntry(
+            content=content.decode() if meta["text"] else content,
+            etag=meta["etag"],
+            last_modified=meta["last_modified"],
+            expires_at=meta["expires_at"],
+        )
+
+    def set(self, key, entry):
+        is_text = isinstance(entry.content, str)
+        meta = {
+            "key": key,
+            "text": is_text,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "expires_at": entry.expires_at,
+        }
+
+        path = self._path(key)
+        with self._lock:
+            with open(f"{path}.tmp", "wb") as file:
+                file.write(json.dumps(meta).encode() + b"\n")
+                file.write(entry.content.encode() if is_text else entry.content)
+            os.replace(f"{path}.tmp", path)
+            self._touch(path)
+
+            if self.max_size is not None:
+                self._evict()
+
+    def delete(self, key):
+        with self._lock:
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+
+    def clear(self):
+        with self._lock:
+            for path in self._paths():
+                os.remove(path)
+
+    def _path(self, key):
+        return os.path.join(
+            self.directory, hashlib.sha256(key.encode()).hexdigest() + ".cache"
+        )
+
+    def _paths(self):
+        return [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith(".cache")
+        ]
+
+    def _touch(self, path):
+        now = time.time()
+        os.utime(path, (now, now))
+
+    def _evict(self):
+        paths = sorted(self._paths(), key=os.path.getmtime, reverse=True)
+        for path in paths[self.max_size :]:
+            os.remove(path)
@@ -1,13 +1,26 @@
 import asyncio
 import copy
+import json
+import random
+import threading
 import time
 import warnings
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from concurrent.futures import as_completed as futures_as_completed
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from functools import wraps
+from itertools import islice
 
 import requests
-from aiohttp import ClientSession
+from aiohttp import ClientSession, TCPConnector
+from requests.adapters import HTTPAdapter
 
-from .response_builder import DefaultResponseBuilder
+from .cache import BaseCache, CacheEntry
+from .errors import ChessDotComError
+from .response_builder import DefaultResponseBuilder, Serializer
+from .utils import parse_archive_url, resolve_date
 
 
 class RateLimitHandler(object):
@@ -16,11 +29,28 @@ class RateLimitHandler(object):
 
     :tts: The time the client will wait after a 429 response if there are tries remaining.
     :retries: The number of times the client will retry calling the API after the first attempt.
+    :backoff_factor: The factor the waiting time is multiplied by after every retry.
+    :max_tts: The maximum time the client will wait between retries. No limit if None.
+    :jitter: The maximum number of seconds of random delay added to the waiting time.
+    :respect_retry_after: Determines if the client waits at least as long as the
+        'Retry-After' header of the response asks for.
     """
 
-    def __init__(self, tts=0, retries=1):
+    def __init__(
+        self,
+        tts=0,
+        retries=1,
+        backoff_factor=1,
+        max_tts=None,
+        jitter=0,
+        respect_retry_after=True,
+    ):
         self.tts = tts
         self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.max_tts = max_tts
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
 
     @property
     def retries(self):
@@ -35,12 +65,150 @@ class RateLimitHandler(object):
             retries = 0
         self._retries = retries
 
-    def should_try_again(self, status_code, resource):
-        if status_code == 429 and self.retries - resource.times_requested >= 0:
-            time.sleep(self.tts)
+    def should_try_again(self, status_code, resource, headers=None):
+        if self._can_try_again(status_code, resource):
+            time.sleep(self.get_tts(resource, headers))
             return True
         return False
 
+    async def should_try_again_async(self, status_code, resource, headers=None):
+        """
+        Same as :meth:`should_try_again`, but waits without blocking the event loop.
+        """
+        if self._can_try_again(status_code, resource):
+            await asyncio.sleep(self.get_tts(resource, headers))
+            return True
+        return False
+
+    def get_tts(self, resource, headers=None):
+        """
+        Returns the number of seconds to wait before retrying the resource.
+        """
+        tts = self.tts * self.backoff_factor ** max(resource.times_requested - 1, 0)
+        if self.max_tts is not None:
+            tts = min(tts, self.max_tts)
+        if self.jitter:
+            tts += random.uniform(0, self.jitter)  # nosec B311
+
+        retry_after = self._get_retry_after(headers)
+        if retry_after is not None:
+            tts = max(tts, retry_after)
+
+        return tts
+
+    def _can_try_again(self, status_code, resource):
+        return status_code == 429 and self.retries - resource.times_requested >= 0
+
+    def _get_retry_after(self, headers):
+        if not self.respect_retry_after or not headers:
+            return None
+
+        value = headers.get("Retry-After")
+        if value is None:
+            return None
+
+        try:
+            return max(float(value), 0)
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0)
+
+
+class RateLimiter(object):
+    """
+    Token bucket limiting the rate of requests sent by a client. The limiter is shared by
+    all endpoints of the client and is safe to use from multiple threads and coroutines.
+
+    :rate: The number of requests per second the client is allowed to send.
+    :burst: The number of requests the client can send at once after being idle.
+    """
+
+    def __init__(self, rate, burst=1):
+        if rate <= 0:
+            raise ValueError("Rate must be greater than 0.")
+        if burst < 1:
+            raise ValueError("Burst can not be less than 1.")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Waits until the client is allowed to send a request.
+        """
+        tts = self._reserve()
+        if tts:
+            time.sleep(tts)
+
+    async def acquire_async(self):
+        """
+        Same as :meth:`acquire`, but waits without blocking the event loop.
+        """
+        tts = self._reserve()
+        if tts:
+            await asyncio.sleep(tts)
+
+    def _reserve(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            self._tokens -= 1
+
+            return max(-self._tokens / self.rate, 0)
+
+
+class ConnectionConfig(object):
+    """
+    Connection pooling options for the sessions owned by a client instance.
+
+    Asynchronous client (aiohttp):
+
+    :pool_size: The maximum number of simultaneous connections the session keeps open.
+    :pool_size_per_host: The maximum number of simultaneous connections to the same host.
+        0 means no limit.
+    :keepalive_timeout: The number of seconds an idle connection is kept open for reuse.
+    :dns_cache_ttl: The number of seconds resolved host addresses are cached for.
+
+    Synchronous client (requests):
+
+    :pool_connections: The number of host connection pools to cache.
+    :pool_maxsize: The maximum number of connections kept open in each pool.
+    :pool_block: Determines if a request waits for a free connection
+        when the pool is exhausted instead of opening a new one.
+    """
+
+    def __init__(
+        self,
+        pool_size=100,
+        pool_size_per_host=0,
+        keepalive_timeout=15,
+        dns_cache_ttl=10,
+        pool_connections=10,
+        pool_maxsize=10,
+        pool_block=False,
+    ):
+        self.pool_size = pool_size
+        self.pool_size_per_host = pool_size_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+
 
 class Client:
     """
@@ -51,14 +219,53 @@ class Client:
     :cvar aio: Determines if the functions behave asynchronously.
     :cvar :rate_limit_handler: A RateLimitHandler object.
         See :obj:`chessdotcom.client.RateLimitHandler`.
+    :cvar rate_limiter: A RateLimiter object every request waits for. No limit if None.
+        See :obj:`chessdotcom.client.RateLimiter`.
+    :cvar connection_config: A ConnectionConfig object.
+        See :obj:`chessdotcom.client.ConnectionConfig`.
+    :cvar cache: A cache object storing responses. No caching if None.
+        See :obj:`chessdotcom.cache.BaseCache`.
+    :cvar persist_session: Determines if the client reuses one session for all requests.
+    :cvar stream_chunk_size: Number of bytes read at a time from streamed responses.
+    :cvar lazy: Determines if the models of a response are built on first access.
+    :cvar decode_bytes: Determines if the body of a response is decoded straight from bytes,
+        without decoding it into a string first. ``response.text`` is None.
+    :cvar coalesce: Determines if identical requests made at the same time
+        by the asynchronous client share one request to the API.
+    :cvar retain: Representations of a response kept besides its models:
+        "all", "json", "text" or "models" (none).
+    :cvar typed: Determines if responses with a schema in :mod:`chessdotcom.schemas`
+        are decoded straight into typed structs.
+    :cvar serializer: A Serializer object decoding the responses. The response builders
+        use their own if None. See :obj:`chessdotcom.response_builder.Serializer`.
+    :cvar executor: A concurrent.futures.Executor the responses are built in,
+        e.g. a ProcessPoolExecutor. Responses are built by the client if None.
     :loop_callback: Function that returns the current loop for aiohttp.ClientSession.
     """
 
     aio = False
     request_config = {"headers": {}}
     rate_limit_handler = RateLimitHandler(tts=0, retries=1)
+    rate_limiter = None
+    connection_config = ConnectionConfig()
+    cache = None
+    persist_session = False
+    stream_chunk_size = 64 * 1024
+    lazy = False
+    decode_bytes = False
+    retain = "all"
+    coalesce = False
+    typed = False
+    serializer = None
+    executor = None
     endpoints = []
 
+    _async_session = None
+    _async_session_loop = None
+    _sync_session = None
+    _in_flight = None
+    _sync_session_lock = threading.Lock()
+
     @classmethod
     def endpoint(cls, func):
         cls.endpoints.append(func)
@@ -70,25 +277,133 @@ class Client:
         return asyncio.get_running_loop()
 
     def do_get_request(self, resource):
+        self._configure_response_builder(resource.response_builder)
+
+        if resource.stream:
+            return self.do_stream_request(resource)
+
+        if self.aio:
+            if self.coalesce:
+                return self._do_coalesced_async_get_request(resource)
+            return self._wait_and_do_async_get_request(resource)
+
+        cache_entry = self._get_fresh_cache_entry(resource)
+        if cache_entry is not None:
+            return self._build_response(resource, cache_entry.content)
+
         if resource.tts:
             time.sleep(resource.tts)
 
-        _do_get_request = (
-            self._do_async_get_request if self.aio else self._do_sync_get_request
+        return self._do_sync_get_request(resource)
+
+    def do_stream_request(self, resource):
+        """
+        Reads the response body of the resource incrementally and yields the
+        objects parsed by the parser of its response builder as they complete.
+        Streamed responses are not cached.
+
+        :returns: Iterator of parsed objects.
+            Returns an async iterator if the client is asynchronous.
+        """
+        _do_stream_request = (
+            self._do_async_stream_request if self.aio else self._do_sync_stream_request
         )
 
-        return _do_get_request(resource)
+        return _do_stream_request(resource)
+
+    def fetch_many(self, calls, concurrency=10, as_completed=False):
+        """
+        Runs many endpoint calls with a bounded number of them in flight at once.
+        All calls share the client's session.
+
+        :param calls: List of endpoint calls. Zero-argument callables are accepted
+            in both modes, e.g. ``functools.partial(client.get_player_profile, "hikaru")``.
+            In asynchronous mode the coroutines returned by the client's endpoints
+            are accepted as well, e.g. ``client.get_player_profile("hikaru")``.
+        :param concurrency: The maximum number of calls in flight at once.
+        :param as_completed: If True, returns an iterator of ``(index, result)`` tuples
+            in the order the calls complete. Otherwise returns a list of results
+            in the order of ``calls``.
+        :returns: Results of the calls. A call that fails with :obj:`ChessDotComError`
+            yields the error object in place of its response.
+            Returns a coroutine (or an async iterator) if the client is asynchronous.
+        """
+        if concurrency < 1:
+            raise ValueError("Concurrency can not be less than 1.")
+
+        calls = list(calls)
+        if self.aio:
+            if as_completed:
+                return self._iter_many_async(calls, concurrency)
+            return self._fetch_many_async(calls, concurrency)
+
+        if as_completed:
+            return self._iter_many_sync(calls, concurrency)
+        return self._fetch_many_sync(calls, concurrency)
 
     def activate_endpoint(self, endpoint):
         @wraps(endpoint)
-        def wrapper(*args, **kwargs):
-            return self.do_get_request(endpoint(*args, **kwargs))
+        def wrapper(*args, transform=None, **kwargs):
+            resource = endpoint(*args, **kwargs)
+            resource.endpoint = endpoint.__name__
+            resource.transform = transform
+
+            return self.do_get_request(resource)
 
         setattr(self, endpoint.__name__, wrapper)
         return wrapper
 
-    def _build_request_options(self, resource):
+    def _fetch_one_sync(self, call):
+        try:
+            return call()
+        except ChessDotComError as err:
+            return err
+
+    def _fetch_many_sync(self, calls, concurrency):
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(self._fetch_one_sync, calls))
+
+    def _iter_many_sync(self, calls, concurrency):
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {
+                executor.submit(self._fetch_one_sync, call): index
+                for index, call in enumerate(calls)
+            }
+            for future in futures_as_completed(futures):
+                yield futures[future], future.result()
+
+    async def _fetch_one_async(self, call, semaphore, index=None):
+        async with semaphore:
+            try:
+                result = await (call() if callable(call) else call)
+            except ChessDotComError as err:
+                result = err
+
+        return result if index is None else (index, result)
+
+    async def _fetch_many_async(self, calls, concurrency):
+        semaphore = asyncio.Semaphore(concurrency)
+        return await asyncio.gather(
+            *[self._fetch_one_async(call, semaphore) for call in calls]
+        )
+
+    async def _iter_many_async(self, calls, concurrency):
+        semaphore = asyncio.Semaphore(concurrency)
+        for future in asyncio.as_completed(
+            [
+                self._fetch_one_async(call, semaphore, index)
+                for index, call in enumerate(calls)
+            ]
+        ):
+            yield await future
+
+    def _build_request_options(self, resource, cache_entry=None):
         options = {**resource.request_options, **self.request_config}
+        if cache_entry is not None and cache_entry.can_revalidate():
+            options["headers"] = {
+                **options["headers"],
+                **cache_entry.conditional_headers(),
+            }
 
         if "user-agent" not in [header.lower() for header in options["headers"].keys()]:
             warnings.warn(
@@ -101,34 +416,331 @@ class Client:
         return options
 
     def _do_sync_get_request(self, resource):
-        r = requests.get(
-            url=resource.url, **self._build_request_options(resource), timeout=30
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+
+        cache_entry = self._get_cache_entry(resource)
+        session = self._get_sync_session() if self.persist_session else requests
+        r = session.get(
+            url=resource.url,
+            **self._build_request_options(resource, cache_entry),
+            timeout=30,
         )
         resource.times_requested += 1
 
+        if r.status_code == 304 and cache_entry is not None:
+            self._refresh_cache_entry(resource, cache_entry)
+            return self._build_response(resource, cache_entry.content)
         if r.status_code != 200:
-            if self.rate_limit_handler.should_try_again(r.status_code, resource):
+            if self.rate_limit_handler.should_try_again(
+                r.status_code, resource, r.headers
+            ):
                 return self._do_sync_get_request(resource)
             raise resource.response_builder.build_client_error(
                 status_code=r.status_code, response_text=r.text, headers=r.headers
             )
-        return resource.response_builder.build(r.text)
+
+        content = r.content if self.decode_bytes else r.text
+        self._set_cache_entry(resource, content, r.headers)
+        return self._build_response(resource, content)
+
+    def _do_sync_stream_request(self, resource):
+        if resource.tts and not resource.times_requested:
+            time.sleep(resource.tts)
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+
+        session = self._get_sync_session() if self.persist_session else requests
+        with session.get(
+            url=resource.url,
+            **self._build_request_options(resource),
+            timeout=30,
+            stream=True,
+        ) as r:
+            resource.times_requested += 1
+
+            if r.status_code != 200:
+                if self.rate_limit_handler.should_try_again(
+                    r.status_code, resource, r.headers
+                ):
+                    yield from self._do_sync_stream_request(resource)
+                    return
+                raise resource.response_builder.build_client_error(
+                    status_code=r.status_code, response_text=r.text, headers=r.headers
+                )
+
+            parser = resource.response_builder.build_stream_parser()
+            for chunk in r.iter_content(chunk_size=self.stream_chunk_size):
+                yield from parser.feed(chunk)
+            yield from parser.close()
+
+    async def _do_async_stream_request(self, resource):
+        if resource.tts:
+            await asyncio.sleep(resource.tts)
+
+        if self.persist_session:
+            session_stream = self._do_async_session_stream_request(
+                self._get_async_session(), resource
+            )
+            async for item in session_stream:
+                yield item
+            return
+
+        async with self._create_async_session() as session:
+            async for item in self._do_async_session_stream_request(session, resource):
+                yield item
+
+    async def _do_async_session_stream_request(self, session, resource):
+        if self.rate_limiter:
+            await self.rate_limiter.acquire_async()
+
+        async with session.get(
+            url=resource.url, **self._build_request_options(resource)
+        ) as r:
+            resource.times_requested += 1
+
+            if r.status != 200:
+                text = await r.text()
+                if await self.rate_limit_handler.should_try_again_async(
+                    r.status, resource, r.headers
+                ):
+                    retry = self._do_async_session_stream_request(session, resource)
+                    async for item in retry:
+                        yield item
+                    return
+                raise resource.response_builder.build_client_error(
+                    status_code=r.status, response_text=text, headers=r.headers
+                )
+
+            parser = resource.response_builder.build_stream_parser()
+            async for chunk in r.content.iter_chunked(self.stream_chunk_size):
+                for item in parser.feed(chunk):
+                    yield item
+            for item in parser.close():
+                yield item
+
+    async def _do_coalesced_async_get_request(self, resource):
+        if self._in_flight is None:
+            self._in_flight = {}
+
+        key = (
+            resource.url,
+            json.dumps(resource.request_options, sort_keys=True, default=repr),
+            resource.transform,
+        )
+        request = self._in_flight.get(key)
+        if request is None:
+            request = asyncio.ensure_future(
+                self._wait_and_do_async_get_request(resource)
+            )
+            request.add_done_callback(lambda _: self._in_flight.pop(key, None))
+            self._in_flight[key] = request
+
+        return await asyncio.shield(request)
+
+    async def _wait_and_do_async_get_request(self, resource):
+        cache_entry = self._get_fresh_cache_entry(resource)
+        if cache_entry is not None:
+            return await self._build_response_async(resource, cache_entry.content)
+
+        if resource.tts:
+            await asyncio.sleep(resource.tts)
+
+        return await self._do_async_get_request(resource)
 
     async def _do_async_get_request(self, resource):
-        async with ClientSession(loop=self.loop_callback()) as session:
-            async with session.get(
-                url=resource.url, **self._build_request_options(resource)
-            ) as r:
+        if self.persist_session:
+            return await self._do_async_session_get_request(
+                self._get_async_session(), resource
+            )
+
+        async with self._create_async_session() as session:
+            return await self._do_async_session_get_request(session, resource)
+
+    async def _do_async_session_get_request(self, session, resource):
+        if self.rate_limiter:
+            await self.rate_limiter.acquire_async()
+
+        cache_entry = self._get_cache_entry(resource)
+        async with session.get(
+            url=resource.url, **self._build_request_options(resource, cache_entry)
+        ) as r:
+            resource.times_requested += 1
+
+            if r.status == 304 and cache_entry is not None:
+                self._refresh_cache_entry(resource, cache_entry)
+                return await self._build_response_async(resource, cache_entry.content)
+            if r.status != 200:
                 text = await r.text()
-                resource.times_requested += 1
+                if await self.rate_limit_handler.should_try_again_async(
+                    r.status, resource, r.headers
+                ):
+                    return await self._do_async_get_request(resource)
+                raise resource.response_builder.build_client_error(
+                    status_code=r.status, response_text=text, headers=r.headers
+                )
+
+            content = await r.read() if self.decode_bytes else await r.text()
+            self._set_cache_entry(resource, content, r.headers)
+            return await self._build_response_async(resource, content)
+
+    def _configure_response_builder(self, response_builder):
+        response_builder.lazy = self.lazy
+        response_builder.typed = self.typed
+        if self.serializer is not None:
+            response_builder.serializer = self.serializer
+
+    def _build_response(self, resource, content):
+        if self.executor is None:
+            return build_response(*self._get_build_args(resource, content))
+
+        return self.executor.submit(
+            build_response, *self._get_build_args(resource, content)
+        ).result()
+
+    async def _build_response_async(self, resource, content):
+        if self.executor is None:
+            return self._build_response(resource, content)
+
+        return await asyncio.wrap_future(
+            self.executor.submit(
+                build_response, *self._get_build_args(resource, content)
+            )
+        )
+
+    def _get_build_args(self, resource, content):
+        return (
+            resource.response_builder,
+            content,
+            self.decode_bytes or self.retain not in ("text", "all"),
+            self.retain not in ("json", "all"),
+            resource.transform,
+        )
+
+    def _get_cache_entry(self, resource):
+        if self.cache is None:
+            return None
+
+        return self.cache.get(resource.url)
+
+    def _get_fresh_cache_entry(self, resource):
+        cache_entry = self._get_cache_entry(resource)
+        if cache_entry is None or not cache_entry.is_fresh():
+            return None
+
+        self.cache.record_hit()
+        return cache_entry
+
+    def _get_cache_ttl(self, resource):
+        if resource.immutable:
+            return None
+
+        return self.cache.get_ttl(resource.endpoint)
+
+    def _refresh_cache_entry(self, resource, cache_entry):
+        cache_entry.refresh(self._get_cache_ttl(resource))
+        self.cache.set(resource.url, cache_entry)
+        self.cache.record_hit()
+
+    def _set_cache_entry(self, resource, content, headers):
+        if self.cache is None:
+            return
+
+        self.cache.record_miss()
+        cache_entry = CacheEntry.from_response(
+            content, headers, ttl=self._get_cache_ttl(resource)
+        )
+        if cache_entry is not None:
+            self.cache.set(resource.url, cache_entry)
+
+    def _create_async_session(self):
+        config = self.connection_config
+        return ClientSession(
+            loop=self.loop_callback(),
+            connector=TCPConnector(
+                limit=config.pool_size,
+                limit_per_host=config.pool_size_per_host,
+                keepalive_timeout=config.keepalive_timeout,
+                ttl_dns_cache=config.dns_cache_ttl,
+            ),
+        )
+
+    def _get_async_session(self):
+        loop = self.loop_callback()
+        if (
+            self._async_session is not None
+            and not self._async_session.closed
+            and self._async_session_loop is not loop
+        ):
+            self._release_async_session()
+
+        if self._async_session is None or self._async_session.closed:
+            self._async_session = self._create_async_session()
+            self._async_session_loop = loop
+
+        return self._async_session
+
+    def _release_async_session(self):
+        # The session belongs to another loop, e.g. of a previous asyncio.run call.
+        # It can only be closed by that loop, so it is detached if the loop is not running.
+        if self._async_session_loop.is_running():
+            asyncio.run_coroutine_threadsafe(
+                self._async_session.close(), self._async_session_loop
+            )
+        else:
+            self._async_session.detach()
+        self._async_session = None
+        self._async_session_loop = None
+
+    def _create_sync_session(self):
+        config = self.connection_config
+        adapter = HTTPAdapter(
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
+            pool_block=config.pool_block,
+        )
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _get_sync_session(self):
+        with self._sync_session_lock:
+            if self._sync_session is None:
+                self._sync_session = self._create_sync_session()
+
+        return self._sync_session
+
+    def close(self):
+        """
+        Closes the sessions held by the client.
+        Returns a coroutine if the client is asynchronous.
+        """
+        if self._sync_session is not None:
+            self._sync_session.close()
+        self._sync_session = None
+
+        if self.aio:
+            return self._close_async_session()
+
+    async def _close_async_session(self):
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+        self._async_session = None
+        self._async_session_loop = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    async def __aenter__(self):
+        return self
 
-                if r.status != 200:
-                    if self.rate_limit_handler.should_try_again(r.status, resource):
-                        return await self._do_async_get_request(resource)
-                    raise resource.response_builder.build_client_error(
-                        status_code=r.status, response_text=text, headers=r.headers
-                    )
-                return resource.response_builder.build(text)
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
 
 
 class ChessDotComClient(Client):
@@ -143,8 +755,55 @@ class ChessDotComClient(Client):
         See :obj:`chessdotcom.client.RateLimitHandler`.
     :ivar user_agent: A string that will be used as the User-Agent header in requests to the API.
         This value will override the value in request_config if provided.
+    :ivar rate_limiter: A RateLimiter object limiting the rate of requests
+        sent by the client. See :obj:`chessdotcom.client.RateLimiter`.
+    :ivar connection_config: A ConnectionConfig object controlling the pool of
+        connections kept open by the client. See :obj:`chessdotcom.client.ConnectionConfig`.
+    :ivar cache: A cache object storing responses together with their 'ETag' and
+        'Last-Modified' headers. Fresh responses are served without asking the API,
+        stale ones are requested conditionally and served from the cache when the
+        API answers with 304 Not Modified. See :obj:`chessdotcom.cache.BaseCache`.
+        Archives of completed months never change and are cached without expiry.
+    :ivar lazy: Determines if the models of a response (e.g. ``response.games``)
+        are built on first access instead of when the response is received.
+        Defaults to False.
+    :ivar json_backend: Name of the library decoding the responses:
+        "orjson", "msgspec", "ujson" or "json". Defaults to the fastest one installed.
+    :ivar typed: Determines if responses are decoded straight into the typed structs of
+        :mod:`chessdotcom.schemas` where one is declared (e.g. ``get_player_games_by_month``
+        and ``get_team_match``). The structs have the same attributes as the models
+        and ``response.json`` is only decoded on first access. Requires msgspec.
+        Defaults to False.
+    :ivar decode_bytes: Determines if the body of a response is fed to the JSON decoder
+        as bytes, skipping the decoding into a string and the copy kept in ``response.text``,
+        which is None. Defaults to False.
+    :ivar retain: Representations of a response kept besides its models.
+        "all" keeps both ``response.text`` and ``response.json``, "text" and "json"
+        keep only the one named and "models" keeps neither; the others are None.
+        Defaults to "all".
+    :ivar coalesce: Determines if identical requests (same URL and request options)
+        made while one of them is in flight share that request and its response
+        instead of calling the API again. Only applies to the asynchronous client.
+        Defaults to False.
+    :ivar executor: A concurrent.futures.Executor the responses are built in while
+        the client keeps doing I/O, e.g. ``ProcessPoolExecutor(max_workers=32)``
+        to decode big archives on many cores. Endpoints accept a ``transform``
+        keyword argument, a picklable function applied to the response in the executor
+        (e.g. exporting its games into columns), whose result is returned instead.
+        Streamed responses are parsed by the client and not transformed.
+        The client does not shut the executor down. Defaults to None.
+
+    The client keeps one session open for all of its requests.
+    Use it as a context manager (``with ChessDotComClient() as client:`` or
+    ``async with ChessDotComClient(aio=True) as client:``)
+    or call :meth:`close` to release the connections.
+    An asynchronous client used in a new event loop (e.g. by another ``asyncio.run`` call)
+    opens a new session and drops the one of the previous loop,
+    so close it before its loop ends.
     """
 
+    persist_session = True
+
     def __init__(
         self,
         aio: bool = False,
@@ -152,6 +811,16 @@ class ChessDotComClient(Client):
         request_config: dict = None,
         rate_limit_handler: RateLimitHandler = None,
         verify_ssl: bool = True,
+        connection_config: ConnectionConfig = None,
+        rate_limiter: RateLimiter = None,
+        cache: BaseCache = None,
+        lazy: bool = False,
+        json_backend: str = None,
+        typed: bool = False,
+        decode_bytes: bool = False,
+        retain: str = "all",
+        coalesce: bool = False,
+        executor: Executor = None,
     ) -> None:
         self.aio = aio
 
@@ -163,6 +832,27 @@ class ChessDotComClient(Client):
         )
 
         self.rate_limit_handler = rate_limit_handler or self.rate_limit_handler
+        self.connection_config = connection_config or self.connection_config
+        self.rate_limiter = rate_limiter or self.rate_limiter
+        self.cache = cache if cache is not None else self.cache
+        self.lazy = lazy
+        if json_backend is not None:
+            self.serializer = Serializer(json_backend)
+        if typed:
+            from . import schemas
+
+            schemas
+        self.typed = typed
+        self.decode_bytes = decode_bytes
+
+        if retain not in ("all", "json", "text", "models"):
+            raise ValueError(
+                f"Unknown value of retain '{retain}', "
+                "expected one of 'all', 'json', 'text' or 'models'"
+            )
+        self.retain = retain
+        self.coalesce = coalesce
+        self.executor = executor
 
         # Load endpoints to register
         from . import endpoints
@@ -172,6 +862,147 @@ class ChessDotComClient(Client):
         for endpoint in self.endpoints:
             self.activate_endpoint(endpoint)
 
+    def iter_player_games(
+        self,
+        username: str,
+        since: datetime = None,
+        until: datetime = None,
+        concurrency: int = 4,
+        **request_options,
+    ):
+        """
+        Streams every finished game of a player in chronological order.
+        Monthly archives are fetched concurrently, while games are yielded
+        one month at a time as soon as the month and all months before it are available.
+
+        :param username: username of the player.
+        :param since: datetime.datetime of the first month to include. All months if None.
+        :param until: datetime.datetime of the last month to include. All months if None.
+        :param concurrency: The maximum number of monthly archives fetched at once.
+        :returns: Iterator of :obj:`chessdotcom.endpoints.player_games_by_month.Game`
+            objects. Returns an async iterator if the client is asynchronous.
+        """
+        archives = self.iter_player_archives(
+            username, since, until, concurrency, **request_options
+        )
+        if self.aio:
+            return self._iter_games_async(archives)
+
+        return (game for response in archives for game in response.games)
+
+    def iter_player_archives(
+        self,
+        username: str,
+        since: datetime = None,
+        until: datetime = None,
+        concurrency: int = 4,
+        transform=None,
+        **request_options,
+    ):
+        """
+        Streams the monthly archives of a player in chronological order.
+        Up to ``concurrency`` archives are fetched at once. With an executor
+        (see :obj:`ChessDotComClient`) they are also built and transformed in parallel,
+        while each is yielded as soon as it and all months before it are available.
+
+        :param username: username of the player.
+        :param since: datetime.datetime of the first month to include. All months if None.
+        :param until: datetime.datetime of the last month to include. All months if None.
+        :param concurrency: The maximum number of monthly archives fetched at once.
+        :param transform: Function applied to every
+            :obj:`chessdotcom.endpoints.player_games_by_month.GetPlayerGamesByMonthResponse`,
+            in the executor if the client has one.
+        :returns: Iterator of the responses, or of the results of ``transform``.
+            Returns an async iterator if the client is asynchronous.
+        """
+        if concurrency < 1:
+            raise ValueError("Concurrency can not be less than 1.")
+
+        _iter_player_archives = (
+            self._iter_player_archives_async
+            if self.aio
+            else self._iter_player_archives_sync
+        )
+
+        return _iter_player_archives(
+            username, since, until, concurrency, transform, **request_options
+        )
+
+    def _iter_player_archives_sync(
+        self, username, since, until, concurrency, transform, **request_options
+    ):
+        archives = self.get_player_game_archives(username, **request_options)
+        months = iter(self._select_archive_months(archives.archives, since, until))
+
+        def fetch(month):
+            yyyy, mm = month
+            return executor.submit(
+                self.get_player_games_by_month,
+                username,
+                year=yyyy,
+                month=mm,
+                transform=transform,
+                **request_options,
+            )
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending = deque(fetch(month) for month in islice(months, concurrency))
+            try:
+                while pending:
+                    result = pending.popleft().result()
+                    pending.extend(fetch(month) for month in islice(months, 1))
+
+                    yield result
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    async def _iter_player_archives_async(
+        self, username, since, until, concurrency, transform, **request_options
+    ):
+        archives = await self.get_player_game_archives(username, **request_options)
+        months = iter(self._select_archive_months(archives.archives, since, until))
+
+        def fetch(month):
+            yyyy, mm = month
+            return asyncio.ensure_future(
+                self.get_player_games_by_month(
+                    username,
+                    year=yyyy,
+                    month=mm,
+                    transform=transform,
+                    **request_options,
+                )
+            )
+
+        pending = deque(fetch(month) for month in islice(months, concurrency))
+        try:
+            while pending:
+                result = await pending.popleft()
+                pending.extend(fetch(month) for month in islice(months, 1))
+
+                yield result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    async def _iter_games_async(archives):
+        async for response in archives:
+            for game in response.games:
+                yield game
+
+    @staticmethod
+    def _select_archive_months(archives, since, until):
+        first = resolve_date(None, None, since) if since else None
+        last = resolve_date(None, None, until) if until else None
+
+        return [
+            month
+            for month in sorted(parse_archive_url(url) for url in archives)
+            if (first is None or month >= first) and (last is None or month <= last)
+        ]
+
     def _set_request_options(
         self, request_config, default_request_config, verify_ssl, user_agent
     ):
@@ -195,8 +1026,16 @@ class Resource(object):
         tts=0,
         request_options=None,
         times_requested=0,
+        endpoint=None,
+        immutable=False,
+        stream=False,
+        transform=None,
     ):
         self.url = self.HOST + uri
+        self.endpoint = endpoint
+        self.immutable = immutable
+        self.stream = stream
+        self.transform = transform
         self.response_builder = response_builder or DefaultResponseBuilder()
 
         self.tts = tts
@@ -204,3 +1043,27 @@ class Resource(object):
         self.request_options = request_options or {}
 
         self.response_builder.register_resource(self)
+
+
+def build_response(
+    response_builder, content, drop_text=False, drop_json=False, transform=None
+):
+    """
+    Builds the response of a resource from the body returned by the API.
+    Clients with an executor call it in the executor, e.g. in worker processes,
+    so everything passed to it and its result must be picklable.
+
+    :param response_builder: Response builder of the resource.
+    :param content: str or bytes of the body.
+    :param drop_text: Determines if ``response.text`` is set to None.
+    :param drop_json: Determines if ``response.json`` is set to None.
+    :param transform: Function the response is passed to. Its result is returned
+        in place of the response if set.
+    """
+    response = response_builder.build(content)
+    if drop_text:
+        response.text = None
+    if drop_json:
+        response.json = None
+
+    return response if transform is None else transform(response)
@@ -10,7 +10,7 @@ from typing import Optional
 
 from ..client import Client, Resource
 from ..response_builder import BaseResponseBuilder, ChessDotComResponse
-from ..utils import from_timestamp
+from ..utils import from_timestamp, slotted
 
 
 @Client.endpoint
@@ -35,22 +35,25 @@ class ResponseBuilder(BaseResponseBuilder):
         return GetClubDetailsResponse(
             json={"club": data},
             text=text,
-            club=ClubDetails(
-                name=data.get("name"),
-                url=data.get("url"),
-                icon=data.get("icon"),
-                country=data.get("country"),
-                id=data.get("@id"),
-                club_id=data.get("club_id"),
-                average_daily_rating=data.get("average_daily_rating"),
-                members_count=data.get("members_count"),
-                created=data.get("created"),
-                last_activity=data.get("last_activity"),
-                admin=data.get("admin", []),
-                visibility=data.get("visibility"),
-                join_request=data.get("join_request"),
-                description=data.get("description"),
-            ),
+            club=self.defer(self._build_club, data),
+        )
+
+    def _build_club(self, data):
+        return ClubDetails(
+            name=data.get("name"),
+            url=data.get("url"),
+            icon=data.get("icon"),
+            country=data.get("country"),
+            id=data.get("@id"),
+            club_id=data.get("club_id"),
+            average_daily_rating=data.get("average_daily_rating"),
+            members_count=data.get("members_count"),
+            created=data.get("created"),
+            last_activity=data.get("last_activity"),
+            admin=data.get("admin", []),
+            visibility=data.get("visibility"),
+            join_request=data.get("join_request"),
+            description=data.get("description"),
         )
 
 
@@ -66,6 +69,7 @@ class GetClubDetailsResponse(ChessDotComResponse):
         self.club = club
 
 
+@slotted("last_activity_datetime", "created_datetime")
 @dataclass(repr=True)
 class ClubDetails(object):
     """
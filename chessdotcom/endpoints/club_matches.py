@@ -9,7 +9,7 @@ from typing import Optional
 
 from ..client import Client, Resource
 from ..response_builder import BaseResponseBuilder, ChessDotComResponse
-from ..utils import from_timestamp
+from ..utils import from_timestamp, slotted
 
 
 @Client.endpoint
@@ -32,7 +32,9 @@ class ResponseBuilder(BaseResponseBuilder):
         data = self.serializer.deserialize(text)
 
         return GetClubMatchesResponse(
-            json={"matches": data}, text=text, matches=self._build_club_matches(data)
+            json={"matches": data},
+            text=text,
+            matches=self.defer(self._build_club_matches, data),
         )
 
     def _build_club_matches(self, data):
@@ -68,6 +70,7 @@ class GetClubMatchesResponse(ChessDotComResponse):
         self.matches = matches
 
 
+@slotted()
 @dataclass(repr=True)
 class ClubMatches(object):
     """
@@ -81,6 +84,7 @@ class ClubMatches(object):
     registered: list
 
 
+@slotted("start_datetime")
 @dataclass(repr=True)
 class ClubMatch(object):
     """
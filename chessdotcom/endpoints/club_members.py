@@ -11,7 +11,7 @@ from typing import List, Optional
 
 from ..client import Client, Resource
 from ..response_builder import BaseResponseBuilder, ChessDotComResponse
-from ..utils import from_timestamp
+from ..utils import from_timestamp, slotted
 
 
 @Client.endpoint
@@ -34,7 +34,9 @@ class ResponseBuilder(BaseResponseBuilder):
         data = self.serializer.deserialize(text)
 
         return GetClubMembersResponse(
-            json={"members": data}, text=text, members=self._build_members(data)
+            json={"members": data},
+            text=text,
+            members=self.defer(self._build_members, data),
         )
 
     def _build_members(self, data):
@@ -63,6 +65,7 @@ class GetClubMembersResponse(ChessDotComResponse):
         self.members = members
 
 
+@slotted()
 @dataclass(repr=True)
 class ClubMembers(object):
     """
@@ -76,6 +79,7 @@ class ClubMembers(object):
     all_time: List["ClubMembersDetails"]
 
 
+@slotted("joined_datetime")
 @dataclass(repr=True)
 class ClubMembersDetails(object):
     """
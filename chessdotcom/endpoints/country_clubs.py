@@ -29,7 +29,7 @@ class ResponseBuilder(BaseResponseBuilder):
         data = self.serializer.deserialize(text)
 
         return GetCountryClubsResponse(
-            json=data, text=text, clubs=self._build_clubs(data)
+            json=data, text=text, clubs=self.defer(self._build_clubs, data)
         )
 
     def _build_clubs(self, data):
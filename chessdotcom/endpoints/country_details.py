@@ -9,6 +9,7 @@ from typing import Optional
 
 from ..client import Client, Resource
 from ..response_builder import BaseResponseBuilder, ChessDotComResponse
+from ..utils import slotted
 
 
 @Client.endpoint
@@ -36,9 +37,12 @@ class ResponseBuilder(BaseResponseBuilder):
         return GetCountryDetailsResponse(
             json={"country": data},
             text=text,
-            country=CountryDetails(
-                name=data.get("name"), id=data.get("@id"), code=data.get("code")
-            ),
+            country=self.defer(self._build_country, data),
+        )
+
+    def _build_country(self, data):
+        return CountryDetails(
+            name=data.get("name"), id=data.get("@id"), code=data.get("code")
         )
 
 
@@ -54,6 +58,7 @@ class GetCountryDetailsResponse(ChessDotComResponse):
         self.country = country
 
 
+@slotted()
 @dataclass(repr=True)
 class CountryDetails(object):
     """
@@ -31,7 +31,7 @@ class ResponseBuilder(BaseResponseBuilder):
         data = self.serializer.deserialize(text)
 
         return GetCountryPlayersResponse(
-            json=data, text=text, players=self._build_players(data)
+            json=data, text=text, players=self.defer(self._build_players, data)
         )
 
     def _build_players(self, data):
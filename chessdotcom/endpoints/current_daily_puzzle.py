@@ -9,7 +9,7 @@ from typing import Optional
 
 from ..client import Client, Resource
 from ..response_builder import BaseResponseBuilder, ChessDotComResponse
-from ..utils import from_timestamp
+from ..utils import from_timestamp, slotted
 
 
 @Client.endpoint
@@ -36,14 +36,17 @@ class ResponseBuilder(BaseResponseBuilder):
         return GetCurrentDailyPuzzleResponse(
             json={"puzzle": data},
             text=text,
-            puzzle=Puzzle(
-                title=data.get("title"),
-                url=data.get("url"),
-                publish_time=data.get("publish_time"),
-                fen=data.get("fen"),
-                pgn=data.get("pgn"),
-                image=data.get("image"),
-            ),
+            puzzle=self.defer(self._build_puzzle, data),
+        )
+
+    def _build_puzzle(self, data):
+        return Puzzle(
+            title=data.get("title"),
+            url=data.get("url"),
+            publish_time=data.get("publish_time"),
+            fen=data.get("fen"),
+            pgn=data.get("pgn"),
+            image=data.get("image"),
         )
 
 
@@ -59,6 +62,7 @@ class GetCurrentDailyPuzzleResponse(ChessDotComResponse):
         self.puzzle = puzzle
 
 
+@slotted("publish_datetime")
 @dataclass(repr=True)
 class Puzzle(object):
     """
@@ -10,6 +10,7 @@ from typing import List, Optional
 
 from ..client import Client, Resource
 from ..response_builder import BaseResponseBuilder, ChessDotComResponse
+from ..utils import slotted
 
 
 @Client.endpoint
@@ -34,26 +35,27 @@ class ResponseBuilder(BaseResponseBuilder):
         return GetLeaderboardsResponse(
             json={"leaderboards": data},
             text=text,
-            leaderboards=Leaderboards(
-                daily=self._build_leaderboard(data.get("daily")),
-                daily960=self._build_leaderboard(data.get("daily960")),
-                live_rapid=self._build_leaderboard(data.get("live_rapid")),
-                live_bullet=self._build_leaderboard(data.get("live_bullet")),
-                live_bughouse=self._build_leaderboard(data.get("live_bughouse")),
-                live_blitz=self._build_leaderboard(data.get("live_blitz")),
-                live_threecheck=self._build_leaderboard(data.get("live_threecheck")),
-                live_crazyhouse=self._build_leaderboard(data.get("live_crazyhouse")),
-                live_kingofthehill=self._build_leaderboard(
-                    data.get("live_kingofthehill")
-                ),
-                live_tactics=self._build_leaderboard(data.get("live_tactics")),
-                live_rush=self._build_leaderboard(data.get("live_rush")),
-                live_battle=self._build_leaderboard(data.get("live_battle")),
-                rush=self._build_leaderboard(data.get("rush")),
-                tactics=self._build_leaderboard(data.get("tactics")),
-                live_blitz960=self._build_leaderboard(data.get("live_blitz960")),
-                battle=self._build_leaderboard(data.get("battle")),
-            ),
+            leaderboards=self.defer(self._build_leaderboards, data),
+        )
+
+    def _build_leaderboards(self, data):
+        return Leaderboards(
+            daily=self._build_leaderboard(data.get("daily")),
+            daily960=self._build_leaderboard(data.get("daily960")),
+            live_rapid=self._build_leaderboard(data.get("live_rapid")),
+            live_bullet=self._build_leaderboard(data.get("live_bullet")),
+            live_bughouse=self._build_leaderboard(data.get("live_bughouse")),
+            live_blitz=self._build_leaderboard(data.get("live_blitz")),
+            live_threecheck=self._build_leaderboard(data.get("live_threecheck")),
+            live_crazyhouse=self._build_leaderboard(data.get("live_crazyhouse")),
+            live_kingofthehill=self._build_leaderboard(data.get("live_kingofthehill")),
+            live_tactics=self._build_leaderboard(data.get("live_tactics")),
+            live_rush=self._build_leaderboard(data.get("live_rush")),
+            live_battle=self._build_leaderboard(data.get("live_battle")),
+            rush=self._build_leaderboard(data.get("rush")),
+            tactics=self._build_leaderboard(data.get("tactics")),
+            live_blitz960=self._build_leaderboard(data.get("live_blitz960")),
+            battle=self._build_leaderboard(data.get("battle")),
         )
 
     def _build_leaderboard(self, data):
@@ -99,6 +101,7 @@ class GetLeaderboardsResponse(ChessDotComResponse):
         self.leaderboards = leaderboards
 
 
+@slotted()
 @dataclass(repr=True)
 class Leaderboards(object):
     """
@@ -140,6 +143,7 @@ class Leaderboards(object):
     battle: List["Leaderboard"]
 
 
+@slotted()
 @dataclass(repr=True)
 class Leaderboard(object):
     """
@@ -182,6 +186,7 @@ class Leaderboard(object):
     trend_rank: Optional["TrendRank"]
 
 
+@slotted()
 @dataclass(repr=True)
 class TrendScore(object):
     """
@@ -193,6 +198,7 @@ class TrendScore(object):
     delta: Optional[int]
 
 
+@slotted()
 @dataclass(repr=True)
 class TrendRank(object):
     """
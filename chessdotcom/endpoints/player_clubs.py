@@ -10,7 +10,7 @@ from typing import Optional
 
 from ..client import Client, Resource
 from ..response_builder import BaseResponseBuilder, ChessDotComResponse
-from ..utils import from_timestamp
+from ..utils import from_timestamp, slotted
 
 
 @Client.endpoint
@@ -38,7 +38,7 @@ class ResponseBuilder(BaseResponseBuilder):
         return GetPlayerClubsResponse(
             json={"clubs": data},
             text=text,
-            clubs=self._build_clubs(data),
+            clubs=self.defer(self._build_clubs, data),
         )
 
     def _build_clubs(self, data):
@@ -67,6 +67,7 @@ class GetPlayerClubsResponse(ChessDotComResponse):
         self.clubs = clubs
 
 
+@slotted("last_activity_datetime", "joined_datetime")
 @dataclass(repr=True)
 class Club:
     """
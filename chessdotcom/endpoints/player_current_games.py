@@ -10,7 +10,7 @@ from typing import Optional
 
 from ..client import Client, Resource
 from ..response_builder import BaseResponseBuilder, ChessDotComResponse
-from ..utils import from_timestamp
+from ..utils import from_timestamp, slotted
 
 
 @Client.endpoint
@@ -38,7 +38,7 @@ class ResponseBuilder(BaseResponseBuilder):
         return GetPlayerCurrentGamesResponse(
             json=data,
             text=text,
-            games=self._build_games(data.get("games", [])),
+            games=self.defer(self._build_games, data.get("games", [])),
         )
 
     def _build_games(self, data):
@@ -75,6 +75,7 @@ class GetPlayerCurrentGamesResponse(ChessDotComResponse):
         self.games = games
 
 
+@slotted("start_datetime", "last_activity_datetime")
 @dataclass(repr=True)
 class Game(object):
     """
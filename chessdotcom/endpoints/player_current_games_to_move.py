@@ -10,7 +10,7 @@ from typing import Optional
 
 from ..client import Client, Resource
 from ..response_builder import BaseResponseBuilder, ChessDotComResponse
-from ..utils import from_timestamp
+from ..utils import from_timestamp, slotted
 
 
 @Client.endpoint
@@ -38,17 +38,20 @@ class ResponseBuilder(BaseResponseBuilder):
         return GetPlayerCurrentGamesToMoveResponse(
             json=data,
             text=text,
-            games=[
-                Game(
-                    url=game.get("url"),
-                    move_by=game.get("move_by"),
-                    last_activity=game.get("last_activity"),
-                    draw_offer=game.get("draw_offer"),
-                )
-                for game in data.get("games", [])
-            ],
+            games=self.defer(self._build_games, data),
         )
 
+    def _build_games(self, data):
+        return [
+            Game(
+                url=game.get("url"),
+                move_by=game.get("move_by"),
+                last_activity=game.get("last_activity"),
+                draw_offer=game.get("draw_offer"),
+            )
+            for game in data.get("games", [])
+        ]
+
 
 class GetPlayerCurrentGamesToMoveResponse(ChessDotComResponse):
     """
@@ -62,6 +65,7 @@ class GetPlayerCurrentGamesToMoveResponse(ChessDotComResponse):
         self.games = games
 
 
+@slotted("move_by_datetime", "last_activity_datetime")
 @dataclass(repr=True)
 class Game(object):
     """
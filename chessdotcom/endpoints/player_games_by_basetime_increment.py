@@ -9,7 +9,7 @@ from typing import Optional, Union
 
 from ..client import Client, Resource
 from ..response_builder import BaseResponseBuilder, ChessDotComResponse
-from ..utils import from_timestamp
+from ..utils import from_timestamp, slotted
 
 
 @Client.endpoint
@@ -45,7 +45,7 @@ class ResponseBuilder(BaseResponseBuilder):
         return GetPlayerGamesByBasetimeIncrementResponse(
             json=data,
             text=text,
-            games=self._build_games(data.get("games", [])),
+            games=self.defer(self._build_games, data.get("games", [])),
         )
 
     def _build_games(self, data):
@@ -98,6 +98,7 @@ class GetPlayerGamesByBasetimeIncrementResponse(ChessDotComResponse):
         self.games = games
 
 
+@slotted("end_datetime")
 @dataclass(repr=True)
 class Game(object):
     """
@@ -132,6 +133,7 @@ class Game(object):
         self.end_datetime = from_timestamp(self.end_time)
 
 
+@slotted()
 @dataclass(repr=True)
 class Accuracies(object):
     """
@@ -143,6 +145,7 @@ class Accuracies(object):
     black: Optional[float]
 
 
+@slotted()
 @dataclass(repr=True)
 class PlayerStats(object):
     """
@@ -6,11 +6,16 @@ API doc: https://www.chess.com/news/view/published-data-api#pubapi-endpoint-game
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Union
+from typing import Iterator, Optional, Union
 
 from ..client import Client, Resource
-from ..response_builder import BaseResponseBuilder, ChessDotComResponse
-from ..utils import from_timestamp, resolve_date
+from ..response_builder import (
+    BaseResponseBuilder,
+    ChessDotComResponse,
+    Deferred,
+    JsonArrayStreamParser,
+)
+from ..utils import from_timestamp, is_month_completed, resolve_date, slotted
 
 
 @Client.endpoint
@@ -38,40 +43,81 @@ def get_player_games_by_month(
         tts=tts,
         request_options=request_options,
         response_builder=ResponseBuilder(),
+        immutable=is_month_completed(yyyy, mm),
+    )
+
+
+@Client.endpoint
+def stream_player_games_by_month(
+    username: str,
+    year: Optional[Union[str, int, None]] = None,
+    month: Optional[Union[str, int, None]] = None,
+    datetime_obj: Optional[Union[datetime, None]] = None,
+    tts=0,
+    **request_options,
+) -> Iterator["Game"]:
+    """
+    :param username: username of the player.
+    :param year: the year (yyyy).
+    :param month: the month (mm).
+    :param date: datetime.datetime of the month. Can be passed in instead of month
+                    and year parameters.
+    :param tts: the time the client will wait before making the first request.
+    :returns: Iterator of :obj:`Game` objects, one for every game of the month,
+                parsed while the response is being downloaded.
+                Async iterator if the client is asynchronous.
+    """
+    yyyy, mm = resolve_date(year, month, datetime_obj)
+    return Resource(
+        uri=f"/player/{username}/games/{yyyy}/{mm}",
+        tts=tts,
+        request_options=request_options,
+        response_builder=ResponseBuilder(),
+        stream=True,
     )
 
 
 class ResponseBuilder(BaseResponseBuilder):
     def build(self, text):
+        if self.typed:
+            return GetPlayerGamesByMonthResponse(
+                json=Deferred(self.serializer.deserialize, text),
+                text=text,
+                games=self.decode_typed(text, "GamesArchive").games,
+            )
+
         data = self.serializer.deserialize(text)
 
         return GetPlayerGamesByMonthResponse(
             json=data,
             text=text,
-            games=self._build_games(data.get("games", [])),
+            games=self.defer(self._build_games, data.get("games", [])),
         )
 
+    def build_stream_parser(self):
+        return JsonArrayStreamParser("games", build_item=self._build_game)
+
     def _build_games(self, data):
-        return [
-            Game(
-                url=game.get("url"),
-                pgn=game.get("pgn"),
-                time_control=game.get("time_control"),
-                start_time=game.get("start_time"),
-                end_time=game.get("end_time"),
-                accuracies=self._build_accuracies(game.get("accuracies")),
-                tcn=game.get("tcn"),
-                uuid=game.get("uuid"),
-                initial_setup=game.get("initial_setup"),
-                fen=game.get("fen"),
-                time_class=game.get("time_class"),
-                rules=game.get("rules"),
-                eco=game.get("eco"),
-                white=self._build_player_stats(game.get("white")),
-                black=self._build_player_stats(game.get("black")),
-            )
-            for game in data
-        ]
+        return [self._build_game(game) for game in data]
+
+    def _build_game(self, data):
+        return Game(
+            url=data.get("url"),
+            pgn=data.get("pgn"),
+            time_control=data.get("time_control"),
+            start_time=data.get("start_time"),
+            end_time=data.get("end_time"),
+            accuracies=self._build_accuracies(data.get("accuracies")),
+            tcn=data.get("tcn"),
+            uuid=data.get("uuid"),
+            initial_setup=data.get("initial_setup"),
+            fen=data.get("fen"),
+            time_class=data.get("time_class"),
+            rules=data.get("rules"),
+            eco=data.get("eco"),
+            white=self._build_player_stats(data.get("white")),
+            black=self._build_player_stats(data.get("black")),
+        )
 
     def _build_accuracies(self, data):
         if not data:
@@ -104,6 +150,7 @@ class GetPlayerGamesByMonthResponse(ChessDotComResponse):
         self.games = games
 
 
+@slotted("start_datetime", "end_datetime")
 @dataclass(repr=True)
 class Game(object):
     """
@@ -145,6 +192,7 @@ class Game(object):
         self.end_datetime = from_timestamp(self.end_time)
 
 
+@slotted()
 @dataclass(repr=True)
 class Accuracies(object):
     """
@@ -156,6 +204,7 @@ class Accuracies(object):
     black: Optional[str]
 
 
+@slotted()
 @dataclass(repr=True)
 class PlayerStats(object):
     """
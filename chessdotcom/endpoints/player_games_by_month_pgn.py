@@ -1,11 +1,12 @@
 import warnings
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Union
+from typing import Iterator, Optional, Union
 
 from ..client import Client, Resource
+from ..pgn import PgnGame, PgnStreamParser
 from ..response_builder import BaseResponseBuilder, ChessDotComResponse
-from ..utils import resolve_date
+from ..utils import is_month_completed, resolve_date, slotted
 
 
 @Client.endpoint
@@ -32,17 +33,54 @@ def get_player_games_by_month_pgn(
         tts=tts,
         request_options=request_options,
         response_builder=ResponseBuilder(),
+        immutable=is_month_completed(yyyy, mm),
+    )
+
+
+@Client.endpoint
+def stream_player_games_by_month_pgn(
+    username: str,
+    year: Optional[Union[str, int, None]] = None,
+    month: Optional[Union[str, int, None]] = None,
+    datetime_obj: Optional[Union[datetime, None]] = None,
+    tts=0,
+    **request_options,
+) -> Iterator[PgnGame]:
+    """
+    :param username: username of the player.
+    :param year: the year (yyyy).
+    :param month: the month (mm).
+    :param date: datetime.datetime of the month. Can be passed in instead of month
+                    and year parameters.
+    :param tts: the time the client will wait before making the first request.
+    :returns: Iterator of :obj:`chessdotcom.pgn.PgnGame` objects, one for every game
+                of the month, parsed while the response is being downloaded.
+                Async iterator if the client is asynchronous.
+    """
+    yyyy, mm = resolve_date(year, month, datetime_obj)
+    return Resource(
+        uri=f"/player/{username}/games/{yyyy}/{mm}/pgn",
+        tts=tts,
+        request_options=request_options,
+        response_builder=ResponseBuilder(),
+        stream=True,
     )
 
 
 class ResponseBuilder(BaseResponseBuilder):
     def build(self, text):
+        if isinstance(text, bytes):
+            text = text.decode()
+
         return GetPlayerGamesByMonthResponsePgn(
             json={"pgn": {"pgn": text, "data": text}},
             text=text,
             pgn=Pgn(data=text),
         )
 
+    def build_stream_parser(self):
+        return PgnStreamParser()
+
 
 class GetPlayerGamesByMonthResponsePgn(ChessDotComResponse):
     """
@@ -56,6 +94,7 @@ class GetPlayerGamesByMonthResponsePgn(ChessDotComResponse):
         self.pgn = pgn
 
 
+@slotted()
 @dataclass(repr=True)
 class Pgn(object):
     """
@@ -9,7 +9,7 @@ from typing import List, Optional
 
 from ..client import Client, Resource
 from ..response_builder import BaseResponseBuilder, ChessDotComResponse
-from ..utils import from_timestamp
+from ..utils import from_timestamp, slotted
 
 
 @Client.endpoint
@@ -37,26 +37,29 @@ class ResponseBuilder(BaseResponseBuilder):
         return GetPlayerProfileResponse(
             json={"player": data},
             text=text,
-            player=PlayerProfile(
-                avatar=data.get("avatar"),
-                player_id=data.get("player_id"),
-                id=data.get("@id"),
-                url=data.get("url"),
-                name=data.get("name"),
-                username=data.get("username"),
-                title=data.get("title"),
-                followers=data.get("followers"),
-                country=data.get("country"),
-                last_online=data.get("last_online"),
-                joined=data.get("joined"),
-                status=data.get("status"),
-                is_streamer=data.get("is_streamer"),
-                verified=data.get("verified"),
-                league=data.get("league"),
-                location=data.get("location"),
-                streaming_platforms=self._build_steaming_platforms(
-                    data.get("streaming_platforms", [])
-                ),
+            player=self.defer(self._build_player, data),
+        )
+
+    def _build_player(self, data):
+        return PlayerProfile(
+            avatar=data.get("avatar"),
+            player_id=data.get("player_id"),
+            id=data.get("@id"),
+            url=data.get("url"),
+            name=data.get("name"),
+            username=data.get("username"),
+            title=data.get("title"),
+            followers=data.get("followers"),
+            country=data.get("country"),
+            last_online=data.get("last_online"),
+            joined=data.get("joined"),
+            status=data.get("status"),
+            is_streamer=data.get("is_streamer"),
+            verified=data.get("verified"),
+            league=data.get("league"),
+            location=data.get("location"),
+            streaming_platforms=self._build_steaming_platforms(
+                data.get("streaming_platforms", [])
             ),
         )
 
@@ -79,6 +82,7 @@ class GetPlayerProfileResponse(ChessDotComResponse):
         super().__init__(json=json, text=text)
 
 
+@slotted()
 @dataclass(repr=True)
 class PlayerProfile:
     """
@@ -128,6 +132,7 @@ class PlayerProfile:
         self.joined_datetime = from_timestamp(self.joined)
 
 
+@slotted()
 @dataclass
 class StreamingPlatform:
     """
@@ -10,7 +10,7 @@ from typing import Optional
 
 from ..client import Client, Resource
 from ..response_builder import BaseResponseBuilder, ChessDotComResponse
-from ..utils import dig, from_timestamp
+from ..utils import dig, from_timestamp, slotted
 
 
 @Client.endpoint
@@ -38,16 +38,19 @@ class ResponseBuilder(BaseResponseBuilder):
         return GetPlayerStatsResponse(
             json={"stats": data},
             text=text,
-            stats=PlayerStats(
-                fide=data.get("fide"),
-                chess_rapid=self._build_game_stats(data.get("chess_rapid")),
-                chess_bullet=self._build_game_stats(data.get("chess_bullet")),
-                chess_blitz=self._build_game_stats(data.get("chess_blitz")),
-                chess_daily=self._build_game_stats(data.get("chess_daily")),
-                chess960_daily=self._build_game_stats(data.get("chess960_daily")),
-                tactics=self._build_tactics_stats(data.get("tactics")),
-                puzzle_rush=self._build_puzzle_rush_stats(data.get("puzzle_rush")),
-            ),
+            stats=self.defer(self._build_stats, data),
+        )
+
+    def _build_stats(self, data):
+        return PlayerStats(
+            fide=data.get("fide"),
+            chess_rapid=self._build_game_stats(data.get("chess_rapid")),
+            chess_bullet=self._build_game_stats(data.get("chess_bullet")),
+            chess_blitz=self._build_game_stats(data.get("chess_blitz")),
+            chess_daily=self._build_game_stats(data.get("chess_daily")),
+            chess960_daily=self._build_game_stats(data.get("chess960_daily")),
+            tactics=self._build_tactics_stats(data.get("tactics")),
+            puzzle_rush=self._build_puzzle_rush_stats(data.get("puzzle_rush")),
         )
 
     def _build_game_stats(self, data):
@@ -119,6 +122,7 @@ class GetPlayerStatsResponse(ChessDotComResponse):
         super().__init__(json=json, text=text)
 
 
+@slotted()
 @dataclass(repr=True)
 class PlayerStats(object):
     """
@@ -142,6 +146,7 @@ class PlayerStats(object):
     puzzle_rush: Optional["PuzzleRushStats"]
 
 
+@slotted()
 @dataclass(repr=True)
 class GameStats(object):
     """
@@ -157,6 +162,7 @@ class GameStats(object):
     tournament: Optional["TournamentGameStats"]
 
 
+@slotted("datetime")
 @dataclass(repr=True)
 class LastGameStats(object):
     """
@@ -174,6 +180,7 @@ class LastGameStats(object):
         self.datetime = from_timestamp(self.date)
 
 
+@slotted("datetime")
 @dataclass(repr=True)
 class BestGameStats(object):
     """
@@ -191,6 +198,7 @@ class BestGameStats(object):
         self.datetime = from_timestamp(self.date)
 
 
+@slotted()
 @dataclass(repr=True)
 class RecordGameStats(object):
     """
@@ -204,6 +212,7 @@ class RecordGameStats(object):
     draw: Optional[int]
 
 
+@slotted()
 @dataclass(repr=True)
 class TournamentGameStats(object):
     """
@@ -219,6 +228,7 @@ class TournamentGameStats(object):
     highest_finish: Optional[int]
 
 
+@slotted()
 @dataclass(repr=True)
 class TacticStats(object):
     """
@@ -230,6 +240,7 @@ class TacticStats(object):
     lowest: "TacticStatsRecord"
 
 
+@slotted("datetime")
 @dataclass(repr=True)
 class TacticStatsRecord(object):
     """
@@ -245,6 +256,7 @@ class TacticStatsRecord(object):
         self.datetime = from_timestamp(self.date)
 
 
+@slotted()
 @dataclass(repr=True)
 class PuzzleRushStats(object):
     """
@@ -254,6 +266,7 @@ class PuzzleRushStats(object):
     best: "PuzzleRushRecord"
 
 
+@slotted()
 @dataclass(repr=True)
 class PuzzleRushRecord(object):
     """
@@ -10,7 +10,7 @@ from typing import List, Optional
 
 from ..client import Client, Resource
 from ..response_builder import BaseResponseBuilder, ChessDotComResponse
-from ..utils import dig
+from ..utils import dig, slotted
 
 
 @Client.endpoint
@@ -39,43 +39,46 @@ class ResponseBuilder(BaseResponseBuilder):
         return GetPlayerTeamMatchesResponse(
             json={"matches": data},
             text=text,
-            matches=TeamMatches(
-                finished=[
-                    FinishedMatches(
-                        name=match.get("name"),
-                        url=match.get("url"),
-                        id=match.get("@id"),
-                        club=match.get("club"),
-                        results=Results(
-                            played_as_white=dig(match, ("results", "played_as_white")),
-                            played_as_black=dig(match, ("results", "played_as_black")),
-                        )
-                        if match.get("results")
-                        else None,
-                        board=match.get("board"),
-                    )
-                    for match in data.get("finished", [])
-                ],
-                in_progress=[
-                    InProgressMatches(
-                        name=match.get("name"),
-                        url=match.get("url"),
-                        id=match.get("@id"),
-                        club=match.get("club"),
-                        board=match.get("board"),
-                    )
-                    for match in data.get("in_progress", [])
-                ],
-                registered=[
-                    RegisteredMatches(
-                        name=match.get("name"),
-                        url=match.get("url"),
-                        id=match.get("@id"),
-                        club=match.get("club"),
+            matches=self.defer(self._build_matches, data),
+        )
+
+    def _build_matches(self, data):
+        return TeamMatches(
+            finished=[
+                FinishedMatches(
+                    name=match.get("name"),
+                    url=match.get("url"),
+                    id=match.get("@id"),
+                    club=match.get("club"),
+                    results=Results(
+                        played_as_white=dig(match, ("results", "played_as_white")),
+                        played_as_black=dig(match, ("results", "played_as_black")),
                     )
-                    for match in data.get("registered", [])
-                ],
-            ),
+                    if match.get("results")
+                    else None,
+                    board=match.get("board"),
+                )
+                for match in data.get("finished", [])
+            ],
+            in_progress=[
+                InProgressMatches(
+                    name=match.get("name"),
+                    url=match.get("url"),
+                    id=match.get("@id"),
+                    club=match.get("club"),
+                    board=match.get("board"),
+                )
+                for match in data.get("in_progress", [])
+            ],
+            registered=[
+                RegisteredMatches(
+                    name=match.get("name"),
+                    url=match.get("url"),
+                    id=match.get("@id"),
+                    club=match.get("club"),
+                )
+                for match in data.get("registered", [])
+            ],
         )
 
 
@@ -91,6 +94,7 @@ class GetPlayerTeamMatchesResponse(ChessDotComResponse):
         self.matches = matches
 
 
+@slotted()
 @dataclass(repr=True)
 class TeamMatches(object):
     """
@@ -104,6 +108,7 @@ class TeamMatches(object):
     registered: List["RegisteredMatches"]
 
 
+@slotted()
 @dataclass(repr=True)
 class FinishedMatches(object):
     """
@@ -123,6 +128,7 @@ class FinishedMatches(object):
     board: Optional[str]
 
 
+@slotted()
 @dataclass(repr=True)
 class InProgressMatches(object):
     """
@@ -140,6 +146,7 @@ class InProgressMatches(object):
     board: Optional[str]
 
 
+@slotted()
 @dataclass(repr=True)
 class RegisteredMatches(object):
     """
@@ -155,6 +162,7 @@ class RegisteredMatches(object):
     club: Optional[str]
 
 
+@slotted()
 @dataclass(repr=True)
 class Results(object):
     """
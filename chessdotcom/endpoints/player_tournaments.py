@@ -9,6 +9,7 @@ from typing import Optional
 
 from ..client import Client, Resource
 from ..response_builder import BaseResponseBuilder, ChessDotComResponse
+from ..utils import slotted
 
 
 @Client.endpoint
@@ -37,39 +38,42 @@ class ResponseBuilder(BaseResponseBuilder):
         return GetPlayerTournamentsResponse(
             json={"tournaments": data},
             text=text,
-            tournaments=Tournaments(
-                finished=[
-                    FinishedTournament(
-                        url=tournament.get("url"),
-                        id=tournament.get("@id"),
-                        wins=tournament.get("wins"),
-                        losses=tournament.get("losses"),
-                        draws=tournament.get("draws"),
-                        placement=tournament.get("placement"),
-                        status=tournament.get("status"),
-                        total_players=tournament.get("total_players"),
-                        time_class=tournament.get("time_class"),
-                        type=tournament.get("type"),
-                    )
-                    for tournament in data.get("finished", [])
-                ],
-                in_progress=[
-                    InProgressTournament(
-                        url=tournament.get("url"),
-                        id=tournament.get("@id"),
-                        status=tournament.get("status"),
-                    )
-                    for tournament in data.get("in_progress", [])
-                ],
-                registered=[
-                    RegisteredTournament(
-                        url=tournament.get("url"),
-                        id=tournament.get("@id"),
-                        status=tournament.get("status"),
-                    )
-                    for tournament in data.get("registered", [])
-                ],
-            ),
+            tournaments=self.defer(self._build_tournaments, data),
+        )
+
+    def _build_tournaments(self, data):
+        return Tournaments(
+            finished=[
+                FinishedTournament(
+                    url=tournament.get("url"),
+                    id=tournament.get("@id"),
+                    wins=tournament.get("wins"),
+                    losses=tournament.get("losses"),
+                    draws=tournament.get("draws"),
+                    placement=tournament.get("placement"),
+                    status=tournament.get("status"),
+                    total_players=tournament.get("total_players"),
+                    time_class=tournament.get("time_class"),
+                    type=tournament.get("type"),
+                )
+                for tournament in data.get("finished", [])
+            ],
+            in_progress=[
+                InProgressTournament(
+                    url=tournament.get("url"),
+                    id=tournament.get("@id"),
+                    status=tournament.get("status"),
+                )
+                for tournament in data.get("in_progress", [])
+            ],
+            registered=[
+                RegisteredTournament(
+                    url=tournament.get("url"),
+                    id=tournament.get("@id"),
+                    status=tournament.get("status"),
+                )
+                for tournament in data.get("registered", [])
+            ],
         )
 
 
@@ -86,6 +90,7 @@ class GetPlayerTournamentsResponse(ChessDotComResponse):
         self.tournaments = tournaments
 
 
+@slotted()
 @dataclass(repr=True)
 class Tournaments(object):
     """
@@ -99,6 +104,7 @@ class Tournaments(object):
     registered: list
 
 
+@slotted()
 @dataclass(repr=True)
 class FinishedTournament(object):
     """
@@ -128,6 +134,7 @@ class FinishedTournament(object):
     type: Optional[str]
 
 
+@slotted()
 @dataclass(repr=True)
 class InProgressTournament(object):
     """
@@ -143,6 +150,7 @@ class InProgressTournament(object):
     status: Optional[str]
 
 
+@slotted()
 @dataclass(repr=True)
 class RegisteredTournament(object):
     """
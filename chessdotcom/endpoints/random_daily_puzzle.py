@@ -9,7 +9,7 @@ from typing import Optional
 
 from ..client import Client, Resource
 from ..response_builder import BaseResponseBuilder, ChessDotComResponse
-from ..utils import from_timestamp
+from ..utils import from_timestamp, slotted
 
 
 @Client.endpoint
@@ -34,14 +34,17 @@ class ResponseBuilder(BaseResponseBuilder):
         return GetRandomDailyPuzzleResponse(
             json={"puzzle": data},
             text=text,
-            puzzle=Puzzle(
-                title=data.get("title"),
-                url=data.get("url"),
-                publish_time=data.get("publish_time"),
-                fen=data.get("fen"),
-                pgn=data.get("pgn"),
-                image=data.get("image"),
-            ),
+            puzzle=self.defer(self._build_puzzle, data),
+        )
+
+    def _build_puzzle(self, data):
+        return Puzzle(
+            title=data.get("title"),
+            url=data.get("url"),
+            publish_time=data.get("publish_time"),
+            fen=data.get("fen"),
+            pgn=data.get("pgn"),
+            image=data.get("image"),
         )
 
 
@@ -57,6 +60,7 @@ class GetRandomDailyPuzzleResponse(ChessDotComResponse):
         self.puzzle = puzzle
 
 
+@slotted("publish_datetime")
 @dataclass(repr=True)
 class Puzzle(object):
     """
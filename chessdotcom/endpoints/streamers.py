@@ -10,6 +10,7 @@ from typing import List, Optional
 
 from ..client import Client, Resource
 from ..response_builder import BaseResponseBuilder, ChessDotComResponse
+from ..utils import slotted
 
 
 @Client.endpoint
@@ -34,29 +35,32 @@ class ResponseBuilder(BaseResponseBuilder):
         return GetStreamersResponse(
             json=data,
             text=text,
-            streamers=[
-                Streamer(
-                    username=streamer.get("username"),
-                    avatar=streamer.get("avatar"),
-                    twitch_url=streamer.get("twitch_url"),
-                    url=streamer.get("url"),
-                    is_live=streamer.get("is_live"),
-                    is_community_streamer=streamer.get("is_community_streamer"),
-                    platforms=[
-                        Platform(
-                            type=platform.get("type"),
-                            stream_url=platform.get("stream_url"),
-                            channel_url=platform.get("channel_url"),
-                            is_live=platform.get("is_live"),
-                            is_main_live_platform=platform.get("is_main_live_platform"),
-                        )
-                        for platform in streamer.get("platforms", [])
-                    ],
-                )
-                for streamer in data.get("streamers", [])
-            ],
+            streamers=self.defer(self._build_streamers, data),
         )
 
+    def _build_streamers(self, data):
+        return [
+            Streamer(
+                username=streamer.get("username"),
+                avatar=streamer.get("avatar"),
+                twitch_url=streamer.get("twitch_url"),
+                url=streamer.get("url"),
+                is_live=streamer.get("is_live"),
+                is_community_streamer=streamer.get("is_community_streamer"),
+                platforms=[
+                    Platform(
+                        type=platform.get("type"),
+                        stream_url=platform.get("stream_url"),
+                        channel_url=platform.get("channel_url"),
+                        is_live=platform.get("is_live"),
+                        is_main_live_platform=platform.get("is_main_live_platform"),
+                    )
+                    for platform in streamer.get("platforms", [])
+                ],
+            )
+            for streamer in data.get("streamers", [])
+        ]
+
 
 class GetStreamersResponse(ChessDotComResponse):
     """
@@ -70,6 +74,7 @@ class GetStreamersResponse(ChessDotComResponse):
         self.streamers = streamers
 
 
+@slotted()
 @dataclass(repr=True)
 class Streamer(object):
     """
@@ -91,6 +96,7 @@ class Streamer(object):
     platforms: List["Platform"]
 
 
+@slotted()
 @dataclass(repr=True)
 class Platform(object):
     """
@@ -10,8 +10,8 @@ from dataclasses import dataclass
 from typing import Optional
 
 from ..client import Client, Resource
-from ..response_builder import BaseResponseBuilder, ChessDotComResponse
-from ..utils import dig, from_timestamp
+from ..response_builder import BaseResponseBuilder, ChessDotComResponse, Deferred
+from ..utils import dig, from_timestamp, slotted
 
 
 @Client.endpoint
@@ -32,34 +32,47 @@ def get_team_match(match_id: int, tts=0, **request_options) -> "GetTeamMatchResp
 
 class ResponseBuilder(BaseResponseBuilder):
     def build(self, text):
+        if self.typed:
+            return GetTeamMatchResponse(
+                json=Deferred(self._build_match_json, text),
+                text=text,
+                match=self.decode_typed(text, "TeamMatch"),
+            )
+
         data = self.serializer.deserialize(text)
 
         return GetTeamMatchResponse(
             json={"match": data},
             text=text,
-            match=TeamMatch(
-                name=data.get("name"),
-                url=data.get("url"),
-                id=data.get("@id"),
-                status=data.get("status"),
-                start_time=data.get("start_time"),
-                end_time=data.get("end_time"),
-                boards=data.get("boards"),
-                settings=TeamMatchSettings(
-                    rules=dig(data, ("settings", "rules")),
-                    time_class=dig(data, ("settings", "time_class")),
-                    time_control=dig(data, ("settings", "time_control")),
-                    min_team_players=dig(data, ("settings", "min_team_players")),
-                    max_team_players=dig(data, ("settings", "max_team_players")),
-                    min_required_games=dig(data, ("settings", "min_required_games")),
-                    min_rating=dig(data, ("settings", "min_rating")),
-                    max_rating=dig(data, ("settings", "max_rating")),
-                    autostart=dig(data, ("settings", "autostart")),
-                ),
-                teams=Teams(
-                    team1=self._build_team(dig(data, ("teams", "team1"))),
-                    team2=self._build_team(dig(data, ("teams", "team2"))),
-                ),
+            match=self.defer(self._build_match, data),
+        )
+
+    def _build_match_json(self, text):
+        return {"match": self.serializer.deserialize(text)}
+
+    def _build_match(self, data):
+        return TeamMatch(
+            name=data.get("name"),
+            url=data.get("url"),
+            id=data.get("@id"),
+            status=data.get("status"),
+            start_time=data.get("start_time"),
+            end_time=data.get("end_time"),
+            boards=data.get("boards"),
+            settings=TeamMatchSettings(
+                rules=dig(data, ("settings", "rules")),
+                time_class=dig(data, ("settings", "time_class")),
+                time_control=dig(data, ("settings", "time_control")),
+                min_team_players=dig(data, ("settings", "min_team_players")),
+                max_team_players=dig(data, ("settings", "max_team_players")),
+                min_required_games=dig(data, ("settings", "min_required_games")),
+                min_rating=dig(data, ("settings", "min_rating")),
+                max_rating=dig(data, ("settings", "max_rating")),
+                autostart=dig(data, ("settings", "autostart")),
+            ),
+            teams=Teams(
+                team1=self._build_team(dig(data, ("teams", "team1"))),
+                team2=self._build_team(dig(data, ("teams", "team2"))),
             ),
         )
 
@@ -101,6 +114,7 @@ class GetTeamMatchResponse(ChessDotComResponse):
         self.match = match
 
 
+@slotted("start_datetime", "end_datetime")
 @dataclass(repr=True)
 class TeamMatch(object):
     """
@@ -132,6 +146,7 @@ class TeamMatch(object):
         self.end_datetime = from_timestamp(self.end_time)
 
 
+@slotted()
 @dataclass(repr=True)
 class TeamMatchSettings(object):
     """
@@ -157,6 +172,7 @@ class TeamMatchSettings(object):
     autostart: Optional[bool]
 
 
+@slotted()
 @dataclass(repr=True)
 class Teams(object):
     """
@@ -168,6 +184,7 @@ class Teams(object):
     team2: Optional["Team"]
 
 
+@slotted()
 @dataclass(repr=True)
 class Team(object):
     """
@@ -187,6 +204,7 @@ class Team(object):
     players: list["Player"]
 
 
+@slotted()
 @dataclass(repr=True)
 class Player(object):
     """
@@ -11,7 +11,7 @@ from typing import Optional
 
 from ..client import Client, Resource
 from ..response_builder import BaseResponseBuilder, ChessDotComResponse
-from ..utils import from_timestamp
+from ..utils import from_timestamp, slotted
 
 
 @Client.endpoint
@@ -40,26 +40,29 @@ class ResponseBuilder(BaseResponseBuilder):
         return GetTeamMatchBoardResponse(
             json={"match_board": data},
             text=text,
-            match_board=MatchBoard(
-                board_scores=data.get("board_scores"),
-                games=[
-                    Game(
-                        url=game.get("url"),
-                        pgn=game.get("pgn"),
-                        time_control=game.get("time_control"),
-                        end_time=game.get("end_time"),
-                        start_time=game.get("start_time"),
-                        rated=game.get("rated"),
-                        fen=game.get("fen"),
-                        time_class=game.get("time_class"),
-                        rules=game.get("rules"),
-                        match=game.get("match"),
-                        white=self._build_player(game.get("white")),
-                        black=self._build_player(game.get("black")),
-                    )
-                    for game in data.get("games", [])
-                ],
-            ),
+            match_board=self.defer(self._build_match_board, data),
+        )
+
+    def _build_match_board(self, data):
+        return MatchBoard(
+            board_scores=data.get("board_scores"),
+            games=[
+                Game(
+                    url=game.get("url"),
+                    pgn=game.get("pgn"),
+                    time_control=game.get("time_control"),
+                    end_time=game.get("end_time"),
+                    start_time=game.get("start_time"),
+                    rated=game.get("rated"),
+                    fen=game.get("fen"),
+                    time_class=game.get("time_class"),
+                    rules=game.get("rules"),
+                    match=game.get("match"),
+                    white=self._build_player(game.get("white")),
+                    black=self._build_player(game.get("black")),
+                )
+                for game in data.get("games", [])
+            ],
         )
 
     def _build_player(self, data):
@@ -87,6 +90,7 @@ class GetTeamMatchBoardResponse(ChessDotComResponse):
         self.match_board = match_board
 
 
+@slotted()
 @dataclass(repr=True)
 class MatchBoard(object):
     """
@@ -98,6 +102,7 @@ class MatchBoard(object):
     board_scores: Optional[dict]
 
 
+@slotted("end_datetime", "start_datetime")
 @dataclass(repr=True)
 class Game(object):
     """
@@ -136,6 +141,7 @@ class Game(object):
         self.start_datetime = from_timestamp(self.start_time)
 
 
+@slotted()
 @dataclass(repr=True)
 class GamePlayer(object):
     """
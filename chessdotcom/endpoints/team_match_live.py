@@ -11,7 +11,7 @@ from typing import Optional
 
 from ..client import Client, Resource
 from ..response_builder import BaseResponseBuilder, ChessDotComResponse
-from ..utils import dig, from_timestamp
+from ..utils import dig, from_timestamp, slotted
 
 
 @Client.endpoint
@@ -39,30 +39,33 @@ class ResponseBuilder(BaseResponseBuilder):
         return GetTeamMatchLiveResponse(
             json={"match": data},
             text=text,
-            match=TeamMatch(
-                name=data.get("name"),
-                url=data.get("url"),
-                id=data.get("@id"),
-                status=data.get("status"),
-                start_time=data.get("start_time"),
-                end_time=data.get("end_time"),
-                boards=data.get("boards"),
-                settings=TeamMatchSettings(
-                    rules=dig(data, ("settings", "rules")),
-                    time_class=dig(data, ("settings", "time_class")),
-                    time_control=dig(data, ("settings", "time_control")),
-                    min_team_players=dig(data, ("settings", "min_team_players")),
-                    max_team_players=dig(data, ("settings", "max_team_players")),
-                    min_required_games=dig(data, ("settings", "min_required_games")),
-                    min_rating=dig(data, ("settings", "min_rating")),
-                    max_rating=dig(data, ("settings", "max_rating")),
-                    autostart=dig(data, ("settings", "autostart")),
-                    time_increment=dig(data, ("settings", "time_increment")),
-                ),
-                teams=Teams(
-                    team1=self._build_team(dig(data, ("teams", "team1"))),
-                    team2=self._build_team(dig(data, ("teams", "team2"))),
-                ),
+            match=self.defer(self._build_match, data),
+        )
+
+    def _build_match(self, data):
+        return TeamMatch(
+            name=data.get("name"),
+            url=data.get("url"),
+            id=data.get("@id"),
+            status=data.get("status"),
+            start_time=data.get("start_time"),
+            end_time=data.get("end_time"),
+            boards=data.get("boards"),
+            settings=TeamMatchSettings(
+                rules=dig(data, ("settings", "rules")),
+                time_class=dig(data, ("settings", "time_class")),
+                time_control=dig(data, ("settings", "time_control")),
+                min_team_players=dig(data, ("settings", "min_team_players")),
+                max_team_players=dig(data, ("settings", "max_team_players")),
+                min_required_games=dig(data, ("settings", "min_required_games")),
+                min_rating=dig(data, ("settings", "min_rating")),
+                max_rating=dig(data, ("settings", "max_rating")),
+                autostart=dig(data, ("settings", "autostart")),
+                time_increment=dig(data, ("settings", "time_increment")),
+            ),
+            teams=Teams(
+                team1=self._build_team(dig(data, ("teams", "team1"))),
+                team2=self._build_team(dig(data, ("teams", "team2"))),
             ),
         )
 
@@ -105,6 +108,7 @@ class GetTeamMatchLiveResponse(ChessDotComResponse):
         self.match = match
 
 
+@slotted("start_datetime", "end_datetime")
 @dataclass(repr=True)
 class TeamMatch(object):
     """
@@ -136,6 +140,7 @@ class TeamMatch(object):
         self.end_datetime = from_timestamp(self.end_time)
 
 
+@slotted()
 @dataclass(repr=True)
 class TeamMatchSettings(object):
     """
@@ -163,6 +168,7 @@ class TeamMatchSettings(object):
     autostart: Optional[bool]
 
 
+@slotted()
 @dataclass(repr=True)
 class Teams(object):
     """
@@ -174,6 +180,7 @@ class Teams(object):
     team2: Optional["Team"]
 
 
+@slotted()
 @dataclass(repr=True)
 class Team(object):
     """
@@ -195,6 +202,7 @@ class Team(object):
     fair_play_removals: list[str]
 
 
+@slotted()
 @dataclass(repr=True)
 class Player(object):
     """
@@ -9,7 +9,7 @@ from typing import List, Optional
 
 from ..client import Client, Resource
 from ..response_builder import BaseResponseBuilder, ChessDotComResponse
-from ..utils import dig, from_timestamp
+from ..utils import dig, from_timestamp, slotted
 
 
 @Client.endpoint
@@ -37,46 +37,47 @@ class ResponseBuilder(BaseResponseBuilder):
         return GetTournamentDetailsResponse(
             json={"tournament": data},
             text=text,
-            tournament=TournamentDetails(
-                name=data.get("name"),
-                url=data.get("url"),
-                description=data.get("description"),
-                creator=data.get("creator"),
-                status=data.get("status"),
-                finish_time=data.get("finish_time"),
-                settings=TournamentSettings(
-                    type=dig(data, ("settings", "type")),
-                    rules=dig(data, ("settings", "rules")),
-                    is_rated=dig(data, ("settings", "is_rated")),
-                    is_official=dig(data, ("settings", "is_official")),
-                    is_invite_only=dig(data, ("settings", "is_invite_only")),
-                    min_rating=dig(data, ("settings", "min_rating")),
-                    max_rating=dig(data, ("settings", "max_rating")),
-                    initial_group_size=dig(data, ("settings", "initial_group_size")),
-                    user_advance_count=dig(data, ("settings", "user_advance_count")),
-                    use_tiebreak=dig(data, ("settings", "use_tiebreak")),
-                    allow_vacation=dig(data, ("settings", "allow_vacation")),
-                    winner_places=dig(data, ("settings", "winner_places")),
-                    registered_user_count=dig(
-                        data, ("settings", "registered_user_count")
-                    ),
-                    games_per_opponent=dig(data, ("settings", "games_per_opponent")),
-                    total_rounds=dig(data, ("settings", "total_rounds")),
-                    concurrent_games_per_opponent=dig(
-                        data, ("settings", "concurrent_games_per_opponent")
-                    ),
-                    time_class=dig(data, ("settings", "time_class")),
-                    time_control=dig(data, ("settings", "time_control")),
+            tournament=self.defer(self._build_tournament, data),
+        )
+
+    def _build_tournament(self, data):
+        return TournamentDetails(
+            name=data.get("name"),
+            url=data.get("url"),
+            description=data.get("description"),
+            creator=data.get("creator"),
+            status=data.get("status"),
+            finish_time=data.get("finish_time"),
+            settings=TournamentSettings(
+                type=dig(data, ("settings", "type")),
+                rules=dig(data, ("settings", "rules")),
+                is_rated=dig(data, ("settings", "is_rated")),
+                is_official=dig(data, ("settings", "is_official")),
+                is_invite_only=dig(data, ("settings", "is_invite_only")),
+                min_rating=dig(data, ("settings", "min_rating")),
+                max_rating=dig(data, ("settings", "max_rating")),
+                initial_group_size=dig(data, ("settings", "initial_group_size")),
+                user_advance_count=dig(data, ("settings", "user_advance_count")),
+                use_tiebreak=dig(data, ("settings", "use_tiebreak")),
+                allow_vacation=dig(data, ("settings", "allow_vacation")),
+                winner_places=dig(data, ("settings", "winner_places")),
+                registered_user_count=dig(data, ("settings", "registered_user_count")),
+                games_per_opponent=dig(data, ("settings", "games_per_opponent")),
+                total_rounds=dig(data, ("settings", "total_rounds")),
+                concurrent_games_per_opponent=dig(
+                    data, ("settings", "concurrent_games_per_opponent")
                 ),
-                players=[
-                    TournamentPlayer(
-                        username=player.get("username"),
-                        status=player.get("status"),
-                    )
-                    for player in data.get("players", [])
-                ],
-                rounds=data.get("rounds", []),
+                time_class=dig(data, ("settings", "time_class")),
+                time_control=dig(data, ("settings", "time_control")),
             ),
+            players=[
+                TournamentPlayer(
+                    username=player.get("username"),
+                    status=player.get("status"),
+                )
+                for player in data.get("players", [])
+            ],
+            rounds=data.get("rounds", []),
         )
 
 
@@ -92,6 +93,7 @@ class GetTournamentDetailsResponse(ChessDotComResponse):
         self.tournament = tournament
 
 
+@slotted("finish_datetime")
 @dataclass(repr=True)
 class TournamentDetails(object):
     """
@@ -121,6 +123,7 @@ class TournamentDetails(object):
         self.finish_datetime = from_timestamp(self.finish_time)
 
 
+@slotted()
 @dataclass(repr=True)
 class TournamentSettings(object):
     """
@@ -164,6 +167,7 @@ class TournamentSettings(object):
     time_control: Optional[str]
 
 
+@slotted()
 @dataclass(repr=True)
 class TournamentPlayer(object):
     """
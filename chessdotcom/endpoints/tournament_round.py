@@ -9,6 +9,7 @@ from typing import List, Optional
 
 from ..client import Client, Resource
 from ..response_builder import BaseResponseBuilder, ChessDotComResponse
+from ..utils import slotted
 
 
 @Client.endpoint
@@ -37,16 +38,19 @@ class ResponseBuilder(BaseResponseBuilder):
         return GetTournamentRoundResponse(
             json={"tournament_round": data},
             text=text,
-            tournament_round=TournamentRound(
-                groups=data.get("groups", []),
-                players=[
-                    TournamentPlayer(
-                        username=player.get("username"),
-                        is_advancing=player.get("is_advancing"),
-                    )
-                    for player in data.get("players", [])
-                ],
-            ),
+            tournament_round=self.defer(self._build_tournament_round, data),
+        )
+
+    def _build_tournament_round(self, data):
+        return TournamentRound(
+            groups=data.get("groups", []),
+            players=[
+                TournamentPlayer(
+                    username=player.get("username"),
+                    is_advancing=player.get("is_advancing"),
+                )
+                for player in data.get("players", [])
+            ],
         )
 
 
@@ -62,6 +66,7 @@ class GetTournamentRoundResponse(ChessDotComResponse):
         super().__init__(json=json, text=text)
 
 
+@slotted()
 @dataclass(repr=True)
 class TournamentRound(object):
     """
@@ -73,6 +78,7 @@ class TournamentRound(object):
     players: List["TournamentPlayer"]
 
 
+@slotted()
 @dataclass(repr=True)
 class TournamentPlayer(object):
     """
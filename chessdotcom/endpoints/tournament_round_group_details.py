@@ -10,7 +10,7 @@ from typing import List, Optional, Union
 
 from ..client import Client, Resource
 from ..response_builder import BaseResponseBuilder, ChessDotComResponse
-from ..utils import from_timestamp
+from ..utils import from_timestamp, slotted
 
 
 @Client.endpoint
@@ -40,37 +40,40 @@ class ResponseBuilder(BaseResponseBuilder):
         return GetTournamentRoundGroupDetailsResponse(
             json={"tournament_round_group": data},
             text=text,
-            tournament_round_group=TournamentRoundGroup(
-                players=[
-                    TournamentPlayer(
-                        username=player.get("username"),
-                        points=player.get("points"),
-                        is_advancing=player.get("is_advancing"),
-                        tie_break=player.get("tie_break"),
-                    )
-                    for player in data.get("players", [])
-                ],
-                games=[
-                    TournamentGames(
-                        url=game.get("url"),
-                        pgn=game.get("pgn"),
-                        time_control=game.get("time_control"),
-                        end_time=game.get("end_time"),
-                        rated=game.get("rated"),
-                        fen=game.get("fen"),
-                        start_time=game.get("start_time"),
-                        time_class=game.get("time_class"),
-                        rules=game.get("rules"),
-                        move_by=game.get("move_by"),
-                        last_activity=game.get("last_activity"),
-                        draw_offer=game.get("draw_offer"),
-                        white=self._build_game_player(game.get("white")),
-                        black=self._build_game_player(game.get("black")),
-                    )
-                    for game in data.get("games", [])
-                ],
-                fair_play_removals=data.get("fair_play_removals", []),
-            ),
+            tournament_round_group=self.defer(self._build_tournament_round_group, data),
+        )
+
+    def _build_tournament_round_group(self, data):
+        return TournamentRoundGroup(
+            players=[
+                TournamentPlayer(
+                    username=player.get("username"),
+                    points=player.get("points"),
+                    is_advancing=player.get("is_advancing"),
+                    tie_break=player.get("tie_break"),
+                )
+                for player in data.get("players", [])
+            ],
+            games=[
+                TournamentGames(
+                    url=game.get("url"),
+                    pgn=game.get("pgn"),
+                    time_control=game.get("time_control"),
+                    end_time=game.get("end_time"),
+                    rated=game.get("rated"),
+                    fen=game.get("fen"),
+                    start_time=game.get("start_time"),
+                    time_class=game.get("time_class"),
+                    rules=game.get("rules"),
+                    move_by=game.get("move_by"),
+                    last_activity=game.get("last_activity"),
+                    draw_offer=game.get("draw_offer"),
+                    white=self._build_game_player(game.get("white")),
+                    black=self._build_game_player(game.get("black")),
+                )
+                for game in data.get("games", [])
+            ],
+            fair_play_removals=data.get("fair_play_removals", []),
         )
 
     def _build_game_player(self, data):
@@ -98,6 +101,7 @@ class GetTournamentRoundGroupDetailsResponse(ChessDotComResponse):
         self.tournament_round_group = tournament_round_group
 
 
+@slotted()
 @dataclass(repr=True)
 class TournamentRoundGroup(object):
     """
@@ -111,6 +115,7 @@ class TournamentRoundGroup(object):
     fair_play_removals: List[str]
 
 
+@slotted()
 @dataclass(repr=True)
 class TournamentPlayer(object):
     """
@@ -126,6 +131,7 @@ class TournamentPlayer(object):
     tie_break: Optional[Union[float, int]]
 
 
+@slotted("end_datetime", "start_datetime", "last_activity_datetime", "move_by_datetime")
 @dataclass(repr=True)
 class TournamentGames(object):
     """
@@ -172,6 +178,7 @@ class TournamentGames(object):
         self.move_by_datetime = from_timestamp(self.move_by)
 
 
+@slotted()
 @dataclass(repr=True)
 class GamePlayer(object):
     """
@@ -44,3 +44,6 @@ class ChessDotComDecodingError(ChessDotComError):
     def __init__(self, text, *args: object) -> None:
         self.text = text
         super().__init__(*args)
+
+    def __reduce__(self):
+        return (self.__class__, (self.text, *self.args))
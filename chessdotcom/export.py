@@ -0,0 +1,93 @@
+"""
+Tools for exporting lists of games into column-oriented formats,
+e.g. the games of :obj:`GetPlayerGamesByMonthResponse`,
+:obj:`GetPlayerGamesByBasetimeIncrementResponse` or :obj:`TournamentRoundGroup`.
+
+Nested models are flattened into columns prefixed with the name of the attribute,
+e.g. ``white_rating`` or ``accuracies_black``.
+Arrow and Parquet exports require the pyarrow package.
+"""
+
+from dataclasses import is_dataclass
+from functools import lru_cache
+from typing import Dict, List, get_args, get_type_hints
+
+
+def games_to_columns(games) -> Dict[str, List]:
+    """
+    Converts games into a dictionary of columns, one list of values per attribute.
+
+    :param games: List of game models, e.g. :obj:`Game` objects.
+    :returns: Dictionary of equally long lists keyed by the column name.
+        Values of missing nested models (e.g. ``accuracies``) are None.
+    """
+    games = list(games)
+    if not games:
+        return {}
+
+    return {
+        name: [_get_value(game, path) for game in games]
+        for name, path in _get_columns(type(games[0]))
+    }
+
+
+def games_to_record_batch(games):
+    """
+    Converts games into an Arrow record batch.
+
+    :param games: List of game models, e.g. :obj:`Game` objects.
+    :returns: :obj:`pyarrow.RecordBatch` with one column per attribute.
+    """
+    import pyarrow
+
+    return pyarrow.RecordBatch.from_pydict(games_to_columns(games))
+
+
+def games_to_parquet(games, path, **kwargs) -> None:
+    """
+    Writes games into a Parquet file.
+
+    :param games: List of game models, e.g. :obj:`Game` objects.
+    :param path: Path of the Parquet file.
+    :param kwargs: Extra keyword arguments for :obj:`pyarrow.parquet.write_table`.
+    """
+    import pyarrow
+    import pyarrow.parquet
+
+    table = pyarrow.Table.from_batches([games_to_record_batch(games)])
+    pyarrow.parquet.write_table(table, path, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def _get_columns(model_type, prefix=()):
+    columns = []
+    for name, annotation in get_type_hints(model_type).items():
+        if name.startswith("_"):
+            continue
+
+        nested_type = _get_model_type(annotation)
+        if nested_type is None:
+            columns.append(("_".join(prefix + (name,)), prefix + (name,)))
+        else:
+            columns.extend(_get_columns(nested_type, prefix + (name,)))
+
+    return tuple(columns)
+
+
+def _get_model_type(annotation):
+    for candidate in (annotation,) + get_args(annotation):
+        if isinstance(candidate, type) and (
+            is_dataclass(candidate) or hasattr(candidate, "__struct_fields__")
+        ):
+            return candidate
+
+    return None
+
+
+def _get_value(game, path):
+    for name in path:
+        if game is None:
+            return None
+        game = getattr(game, name)
+
+    return game
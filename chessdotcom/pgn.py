@@ -0,0 +1,246 @@
+"""
+Tools for reading PGN (Portable Game Notation) returned by the API.
+"""
+
+import codecs
+import re
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+from .utils import slotted
+
+TAG_PAIR = re.compile(r'^\[(\w+)\s+"((?:[^"\\]|\\.)*)"\]\s*$')
+ESCAPED_CHAR = re.compile(r"\\(.)")
+CLOCK = re.compile(r"\[%clk (\d+:\d+:\d+(?:\.\d*)?)\]")
+
+
+@slotted()
+@dataclass(repr=True)
+class PgnGame(object):
+    """
+    :ivar headers: Dictionary of the game's tag pairs, e.g. ``{"White": "Grischuk"}``.
+    :ivar movetext: Moves of the game including comments and the result.
+    """
+
+    headers: Dict[str, str]
+    movetext: str
+
+
+@slotted()
+@dataclass(repr=True)
+class ClockBatch(object):
+    """
+    Clock times of many games in a flat array of 32-bit floats, one item per annotated move.
+    The array supports the buffer protocol, e.g.
+    ``numpy.frombuffer(batch.clocks, dtype=numpy.float32)`` does not copy it.
+
+    :ivar clocks: Remaining time of the player to move after each move, in seconds.
+    :ivar offsets: Clock times of the game ``i`` are the items from ``offsets[i]``
+        to ``offsets[i + 1]``. One item longer than the number of games.
+    """
+
+    clocks: array
+    offsets: array
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def game(self, index: int) -> array:
+        """
+        Returns the clock times of the game ``index``.
+        """
+        return self.clocks[self.offsets[index] : self.offsets[index + 1]]
+
+
+class PgnStreamParser(object):
+    """
+    Incremental parser of multi-game PGN. Bytes are fed as they arrive
+    and every game is returned as soon as it is complete, so only one game
+    is held in memory at a time.
+    """
+
+    def __init__(self, encoding="utf-8") -> None:
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self._pending = ""
+        self._headers = {}
+        self._moves = []
+        self._comment_depth = 0
+
+    def feed(self, chunk) -> List[PgnGame]:
+        """
+        Parses the next chunk of the PGN.
+
+        :param chunk: bytes or str.
+        :returns: List of :obj:`PgnGame` objects completed by the chunk.
+        """
+        if isinstance(chunk, bytes):
+            chunk = self._decoder.decode(chunk)
+
+        lines = (self._pending + chunk).split("\n")
+        self._pending = lines.pop()
+
+        return [game for game in map(self._parse_line, lines) if game is not None]
+
+    def close(self) -> List[PgnGame]:
+        """
+        Parses the remaining input.
+
+        :returns: List of :obj:`PgnGame` objects completed by the end of the PGN.
+        """
+        games = self.feed(self._decoder.decode(b"", final=True) + "\n")
+
+        game = self._flush()
+        if game is not None:
+            games.append(game)
+
+        return games
+
+    def _parse_line(self, line):
+        line = line.strip()
+        if not line:
+            return None
+
+        if self._comment_depth == 0:
+            tag_pair = TAG_PAIR.match(line)
+            if tag_pair:
+                game = self._flush() if self._moves else None
+                key, value = tag_pair.groups()
+                self._headers[key] = ESCAPED_CHAR.sub(r"\1", value)
+
+                return game
+
+        self._comment_depth = max(
+            self._comment_depth + line.count("{") - line.count("}"), 0
+        )
+        self._moves.append(line)
+
+    def _flush(self):
+        if not self._headers and not self._moves:
+            return None
+
+        game = PgnGame(headers=self._headers, movetext=" ".join(self._moves))
+        self._headers = {}
+        self._moves = []
+        self._comment_depth = 0
+
+        return game
+
+
+def get_tag(pgn: str, tag: str) -> Optional[str]:
+    """
+    Returns the value of a tag pair of a PGN game, e.g. ``get_tag(game.pgn, "ECO")``.
+    Only the tag section is searched and nothing but the value is copied,
+    which is much cheaper than parsing the whole game.
+
+    :param pgn: PGN string of a single game, e.g. :obj:`Game.pgn`.
+    :param tag: Name of the tag, e.g. "Termination".
+    :returns: Value of the tag or None if the game does not have it.
+    """
+    return get_tags(pgn, [tag])[tag]
+
+
+def get_tags(pgn: str, tags: Iterable[str]) -> Dict[str, Optional[str]]:
+    """
+    Returns the values of the given tag pairs of a PGN game.
+
+    :param pgn: PGN string of a single game, e.g. :obj:`Game.pgn`.
+    :param tags: Names of the tags, e.g. ``["ECO", "TimeControl"]``.
+    :returns: Dictionary of the values keyed by the tag, None for missing tags.
+    """
+    return {tag: values[0] for tag, values in get_tags_batch([pgn], tags).items()}
+
+
+def get_tags_batch(games, tags: Iterable[str]) -> Dict[str, List[Optional[str]]]:
+    """
+    Returns the values of the given tag pairs of many games, one list per tag.
+
+    :param games: Iterable of PGN strings or of games with a ``pgn`` attribute,
+        e.g. :obj:`GetPlayerGamesByMonthResponse.games`.
+    :param tags: Names of the tags, e.g. ``["ECO", "TimeControl"]``.
+    :returns: Dictionary of equally long lists keyed by the tag, None for missing tags.
+    """
+    columns = {tag: [] for tag in tags}
+    prefixes = [(f'[{tag} "', columns[tag]) for tag in columns]
+
+    for game in games:
+        pgn = game if isinstance(game, str) or game is None else game.pgn
+        if not pgn:
+            for _, column in prefixes:
+                column.append(None)
+            continue
+
+        header_end = pgn.find("\n\n")
+        if header_end == -1:
+            header_end = len(pgn)
+        for prefix, column in prefixes:
+            column.append(_find_tag(pgn, prefix, header_end))
+
+    return columns
+
+
+def get_clocks(pgn: str) -> List[float]:
+    """
+    Returns the clock times of the ``[%clk h:mm:ss.s]`` annotations of a PGN game.
+
+    :param pgn: PGN string of a single game, e.g. :obj:`Game.pgn`.
+    :returns: List of the remaining times in seconds, in the order of the moves.
+    """
+    return list(map(_parse_clock, CLOCK.findall(pgn or "")))
+
+
+def get_clocks_batch(games) -> ClockBatch:
+    """
+    Extracts the clock times of many games into flat arrays.
+    Clock values repeat a lot between games, so each distinct one is converted once.
+    Games of e.g. daily chess without clock annotations have no items.
+
+    :param games: Iterable of PGN strings or of games with a ``pgn`` attribute,
+        e.g. :obj:`GetPlayerGamesByMonthResponse.games`.
+    :returns: :obj:`ClockBatch` object.
+    """
+    clocks = array("f")
+    offsets = array("I", [0])
+
+    for game in games:
+        pgn = game if isinstance(game, str) or game is None else game.pgn
+        clocks.extend(map(_parse_clock, CLOCK.findall(pgn or "")))
+        offsets.append(len(clocks))
+
+    return ClockBatch(clocks=clocks, offsets=offsets)
+
+
+@lru_cache(maxsize=65536)
+def _parse_clock(clock):
+    hours, minutes, seconds = clock.split(":")
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def _find_tag(pgn, prefix, header_end):
+    start = pgn.find(prefix, 0, header_end)
+    while start > 0 and pgn[start - 1] != "\n":
+        start = pgn.find(prefix, start + 1, header_end)
+    if start == -1:
+        return None
+
+    start += len(prefix)
+    end = pgn.find('"]', start)
+    while end != -1 and pgn[end - 1] == "\\":
+        end = pgn.find('"]', end + 1)
+    if end == -1:
+        return None
+
+    value = pgn[start:end]
+    return ESCAPED_CHAR.sub(r"\1", value) if "\\" in value else value
+
+
+def parse_pgn(text: str) -> List[PgnGame]:
+    """
+    Splits multi-game PGN into :obj:`PgnGame` objects.
+
+    :param text: PGN string, e.g. :obj:`Pgn.data` of a monthly PGN archive.
+    """
+    parser = PgnStreamParser()
+
+    return parser.feed(text) + parser.close()
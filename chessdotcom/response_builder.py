@@ -1,15 +1,25 @@
+import codecs
+import importlib
 import json
+import re
+from functools import lru_cache
+from typing import List
 
 from .errors import ChessDotComClientError, ChessDotComDecodingError
 
 
 class BaseResponseBuilder(object):
-    def __init__(self, serializer=None) -> None:
+    def __init__(self, serializer=None, lazy=False, typed=False) -> None:
         self.serializer = serializer or Serializer()
+        self.lazy = lazy
+        self.typed = typed
 
     def build(self, text):
         raise NotImplementedError("Method must be defined by the child class")
 
+    def build_stream_parser(self):
+        raise NotImplementedError("Method must be defined by the child class")
+
     def build_client_error(self, status_code: int, response_text: str, headers: dict):
         return ChessDotComClientError(
             status_code=status_code,
@@ -22,6 +32,24 @@ class BaseResponseBuilder(object):
     def register_resource(self, resource):
         self.resource = resource
 
+    def defer(self, func, *args):
+        """
+        Returns ``func(*args)``, or a :obj:`Deferred` value
+        that is built on first access if the builder is lazy.
+        """
+        if self.lazy:
+            return Deferred(func, *args)
+
+        return func(*args)
+
+    def decode_typed(self, text, schema):
+        """
+        Decodes the response straight into a struct of :mod:`chessdotcom.schemas`.
+        """
+        from . import schemas
+
+        return schemas.decode(text, schema)
+
     def _build_json(self, response_text: str):
         try:
             return self.serializer.deserialize(response_text)
@@ -35,10 +63,32 @@ class DefaultResponseBuilder(BaseResponseBuilder):
 
 
 class Serializer(object):
+    """
+    Decodes the API's responses with one of the supported JSON libraries.
+
+    :ivar backend: Name of the JSON library: "orjson", "msgspec", "ujson" or "json".
+        The first one installed is picked, in that order, if "auto".
+    """
+
+    BACKENDS = ("orjson", "msgspec", "ujson", "json")
+
+    def __init__(self, backend="auto") -> None:
+        if backend == "auto":
+            backend = next(name for name in self.BACKENDS if _load_backend(name))
+        elif backend not in self.BACKENDS:
+            raise ValueError(
+                f"Unknown JSON backend '{backend}', expected one of {self.BACKENDS}"
+            )
+        elif not _load_backend(backend):
+            raise ImportError(f"JSON backend '{backend}' is not installed")
+
+        self.backend = backend
+        self._loads, self._errors = _load_backend(backend)
+
     def deserialize(self, text):
         try:
-            data = json.loads(text)
-        except json.JSONDecodeError as err:
+            data = self._loads(text)
+        except self._errors as err:
             raise ChessDotComDecodingError(
                 text, "Response could not be converted to JSON"
             ) from err
@@ -46,6 +96,113 @@ class Serializer(object):
         return data
 
 
+@lru_cache(maxsize=None)
+def _load_backend(name):
+    try:
+        module = importlib.import_module(name)
+    except ImportError:
+        return None
+
+    if name == "msgspec":
+        return module.json.decode, (ValueError, module.DecodeError)
+
+    return module.loads, (ValueError,)
+
+
+class JsonArrayStreamParser(object):
+    """
+    Incremental parser of the array of objects under ``key`` of a JSON object,
+    e.g. the ``games`` of a monthly archive. Bytes are fed as they arrive
+    and every item is returned as soon as it is complete,
+    so the whole response is never held in memory.
+
+    :ivar key: Name of the array in the JSON object.
+    :ivar build_item: Function building a model from the dictionary of an item.
+    """
+
+    WHITESPACE = re.compile(r"[\s,]*")
+
+    def __init__(self, key, build_item=None, encoding="utf-8") -> None:
+        self.key = key
+        self.build_item = build_item or (lambda item: item)
+        self._start = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder(encoding)()
+        self._pending = ""
+        self._in_array = False
+        self._done = False
+
+    def feed(self, chunk) -> List:
+        """
+        Parses the next chunk of the response.
+
+        :param chunk: bytes or str.
+        :returns: List of the items completed by the chunk.
+        """
+        if isinstance(chunk, bytes):
+            chunk = self._text_decoder.decode(chunk)
+        if self._done:
+            return []
+
+        self._pending += chunk
+        if not self._in_array:
+            start = self._start.search(self._pending)
+            if start is None:
+                return []
+
+            self._pending = self._pending[start.end() :]
+            self._in_array = True
+
+        items = []
+        position = 0
+        while True:
+            position = self.WHITESPACE.match(self._pending, position).end()
+            if position == len(self._pending):
+                break
+            if self._pending[position] == "]":
+                self._done = True
+                break
+
+            try:
+                item, position = self._decoder.raw_decode(self._pending, position)
+            except json.JSONDecodeError:
+                break
+
+            items.append(self.build_item(item))
+
+        self._pending = "" if self._done else self._pending[position:]
+        return items
+
+    def close(self) -> List:
+        """
+        Parses the remaining input.
+
+        :returns: List of the items completed by the end of the response.
+        :raises ChessDotComDecodingError: if the array is incomplete.
+            Returns an empty list if the response has no such array.
+        """
+        items = self.feed(self._text_decoder.decode(b"", final=True))
+        if self._in_array and not self._done:
+            raise ChessDotComDecodingError(
+                self._pending, "Response could not be converted to JSON"
+            )
+
+        return items
+
+
+class Deferred(object):
+    """
+    Attribute value of a response that is built on first access.
+    """
+
+    def __init__(self, func, *args) -> None:
+        self.func = func
+        self.args = args
+
+    def resolve(self):
+        return self.func(*self.args)
+
+
 class ChessDotComResponse(object):
     """
     Base object for holding the API's response.
@@ -57,3 +214,22 @@ class ChessDotComResponse(object):
     def __init__(self, text: str, json) -> None:
         self.text = text
         self.json = json
+
+    def __setattr__(self, name, value):
+        if isinstance(value, Deferred):
+            self.__dict__.setdefault("_deferred", {})[name] = value
+            self.__dict__.pop(name, None)
+        else:
+            self.__dict__.get("_deferred", {}).pop(name, None)
+            super().__setattr__(name, value)
+
+    def __getattr__(self, name):
+        deferred = self.__dict__.get("_deferred", {}).get(name)
+        if deferred is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+
+        value = deferred.resolve()
+        setattr(self, name, value)
+        return value
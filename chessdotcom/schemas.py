@@ -0,0 +1,170 @@
+"""
+Schemas decoding responses straight into typed objects in one pass,
+without building intermediate dictionaries. Requires the msgspec package.
+
+The structs have the same public attributes as the models of the matching endpoints.
+"""
+
+from functools import lru_cache
+from typing import List, Optional
+
+import msgspec
+
+from .errors import ChessDotComDecodingError
+from .utils import from_timestamp
+
+
+class Accuracies(msgspec.Struct):
+    """
+    See :obj:`chessdotcom.endpoints.player_games_by_month.Accuracies`.
+    """
+
+    white: Optional[float] = None
+    black: Optional[float] = None
+
+
+class PlayerStats(msgspec.Struct):
+    """
+    See :obj:`chessdotcom.endpoints.player_games_by_month.PlayerStats`.
+    """
+
+    rating: Optional[int] = None
+    result: Optional[str] = None
+    username: Optional[str] = None
+    id: Optional[str] = msgspec.field(default=None, name="@id")
+    uuid: Optional[str] = None
+
+
+class Game(msgspec.Struct):
+    """
+    See :obj:`chessdotcom.endpoints.player_games_by_month.Game`.
+    """
+
+    url: Optional[str] = None
+    pgn: Optional[str] = None
+    time_control: Optional[str] = None
+    start_time: Optional[int] = None
+    end_time: Optional[int] = None
+    accuracies: Optional[Accuracies] = None
+    tcn: Optional[str] = None
+    uuid: Optional[str] = None
+    initial_setup: Optional[str] = None
+    fen: Optional[str] = None
+    time_class: Optional[str] = None
+    rules: Optional[str] = None
+    eco: Optional[str] = None
+    white: Optional[PlayerStats] = None
+    black: Optional[PlayerStats] = None
+
+    @property
+    def start_datetime(self):
+        return from_timestamp(self.start_time)
+
+    @property
+    def end_datetime(self):
+        return from_timestamp(self.end_time)
+
+
+class GamesArchive(msgspec.Struct):
+    """
+    Monthly archive of a player's games.
+    """
+
+    games: List[Game] = []
+
+
+class TeamMatchSettings(msgspec.Struct):
+    """
+    See :obj:`chessdotcom.endpoints.team_match.TeamMatchSettings`.
+    """
+
+    rules: Optional[str] = None
+    time_class: Optional[str] = None
+    time_control: Optional[str] = None
+    min_team_players: Optional[int] = None
+    max_team_players: Optional[int] = None
+    min_required_games: Optional[int] = None
+    min_rating: Optional[int] = None
+    max_rating: Optional[int] = None
+    autostart: Optional[bool] = None
+
+
+class Player(msgspec.Struct):
+    """
+    See :obj:`chessdotcom.endpoints.team_match.Player`.
+    """
+
+    username: Optional[str] = None
+    board: Optional[str] = None
+    stats: Optional[str] = None
+    status: Optional[str] = None
+    played_as_black: Optional[str] = None
+    played_as_white: Optional[str] = None
+    rating: Optional[int] = None
+    timeout_percent: Optional[float] = None
+
+
+class Team(msgspec.Struct):
+    """
+    See :obj:`chessdotcom.endpoints.team_match.Team`.
+    """
+
+    id: Optional[str] = msgspec.field(default=None, name="@id")
+    name: Optional[str] = None
+    url: Optional[str] = None
+    score: Optional[float] = None
+    result: Optional[str] = None
+    players: List[Player] = []
+
+
+class Teams(msgspec.Struct):
+    """
+    See :obj:`chessdotcom.endpoints.team_match.Teams`.
+    """
+
+    team1: Optional[Team] = None
+    team2: Optional[Team] = None
+
+
+class TeamMatch(msgspec.Struct):
+    """
+    See :obj:`chessdotcom.endpoints.team_match.TeamMatch`.
+    """
+
+    name: Optional[str] = None
+    url: Optional[str] = None
+    id: Optional[str] = msgspec.field(default=None, name="@id")
+    status: Optional[str] = None
+    start_time: Optional[int] = None
+    end_time: Optional[int] = None
+    boards: Optional[int] = None
+    settings: TeamMatchSettings = msgspec.field(default_factory=TeamMatchSettings)
+    teams: Teams = msgspec.field(default_factory=Teams)
+
+    @property
+    def start_datetime(self):
+        return from_timestamp(self.start_time)
+
+    @property
+    def end_datetime(self):
+        return from_timestamp(self.end_time)
+
+
+def decode(text, schema):
+    """
+    Decodes a response into the struct ``schema``.
+
+    :param text: str or bytes of the response.
+    :param schema: Name of the struct, e.g. ``"GamesArchive"``.
+    """
+    try:
+        return _get_decoder(schema).decode(text)
+    except msgspec.DecodeError as err:
+        raise ChessDotComDecodingError(
+            text, "Response could not be converted to JSON"
+        ) from err
+
+
+@lru_cache(maxsize=None)
+def _get_decoder(schema):
+    return msgspec.json.Decoder(globals()[schema])
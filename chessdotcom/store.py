@@ -0,0 +1,328 @@
+"""
+Local store of finished games, kept in a SQLite database file.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+from .endpoints.player_games_by_month import Accuracies, Game, PlayerStats
+from .pgn import get_tag
+from .utils import is_month_completed, parse_archive_url
+
+PLAYER_COLUMNS = ("rating", "result", "username", "id", "uuid")
+COLUMNS = (
+    ("uuid", "TEXT PRIMARY KEY"),
+    ("url", "TEXT"),
+    ("pgn", "TEXT"),
+    ("time_control", "TEXT"),
+    ("start_time", "INTEGER"),
+    ("end_time", "INTEGER"),
+    ("accuracies_white", "REAL"),
+    ("accuracies_black", "REAL"),
+    ("tcn", "TEXT"),
+    ("initial_setup", "TEXT"),
+    ("fen", "TEXT"),
+    ("time_class", "TEXT"),
+    ("rules", "TEXT"),
+    ("eco", "TEXT"),
+    ("eco_code", "TEXT"),
+    ("white_rating", "INTEGER"),
+    ("white_result", "TEXT"),
+    ("white_username", "TEXT COLLATE NOCASE"),
+    ("white_id", "TEXT"),
+    ("white_uuid", "TEXT"),
+    ("black_rating", "INTEGER"),
+    ("black_result", "TEXT"),
+    ("black_username", "TEXT COLLATE NOCASE"),
+    ("black_id", "TEXT"),
+    ("black_uuid", "TEXT"),
+)
+INDEXED_COLUMNS = (
+    "white_username",
+    "black_username",
+    "end_time",
+    "time_class",
+    "rules",
+    "eco_code",
+)
+
+# Statements are built from the constants above, never from user input.
+COLUMN_NAMES = ", ".join(name for name, _ in COLUMNS)
+CREATE_GAMES = (
+    f"CREATE TABLE IF NOT EXISTS games ({', '.join(f'{n} {t}' for n, t in COLUMNS)})"
+)
+CREATE_INDEXES = [
+    f"CREATE INDEX IF NOT EXISTS games_{column} ON games ({column})"
+    for column in INDEXED_COLUMNS
+]
+INSERT_GAMES = (
+    f"INSERT OR IGNORE INTO games ({COLUMN_NAMES}) "  # nosec B608 - constant columns
+    f"VALUES ({', '.join('?' for _ in COLUMNS)})"
+)
+SELECT_GAMES = f"SELECT {COLUMN_NAMES} FROM games"  # nosec B608 - constant columns
+
+
+class GameStore(object):
+    """
+    Store of finished games in a SQLite database file. Games are keyed by their UUID,
+    so a game added twice (e.g. from the archives of both players) is kept once.
+
+    :ivar path: Path of the database file. Created if it does not exist.
+        ``":memory:"`` keeps the games in memory.
+    """
+
+    def __init__(self, path=":memory:") -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+
+        with self._lock, self._connection:
+            self._connection.execute(CREATE_GAMES)
+            for create_index in CREATE_INDEXES:
+                self._connection.execute(create_index)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS watermarks ("
+                "username TEXT COLLATE NOCASE PRIMARY KEY, "
+                "last_month TEXT, "
+                "last_end_time INTEGER)"
+            )
+
+    def add_games(self, games) -> int:
+        """
+        Adds games to the store. Games already in the store are skipped.
+
+        :param games: Iterable of :obj:`Game` objects,
+            e.g. :obj:`GetPlayerGamesByMonthResponse.games`.
+        :returns: Number of games added.
+        """
+        rows = [self._to_row(game) for game in games if game.uuid]
+        with self._lock, self._connection:
+            before = self._connection.total_changes
+            self._connection.executemany(INSERT_GAMES, rows)
+
+            return self._connection.total_changes - before
+
+    def query(
+        self,
+        username: str = None,
+        since: datetime = None,
+        until: datetime = None,
+        time_class: str = None,
+        rules: str = None,
+        eco: str = None,
+        limit: int = None,
+    ) -> List[Game]:
+        """
+        Returns the stored games matching all of the given filters,
+        ordered by the time they ended.
+
+        :param username: username of either player, case-insensitive.
+        :param since: datetime.datetime (UTC) of the earliest end of a game.
+        :param until: datetime.datetime (UTC) of the latest end of a game.
+        :param time_class: time class of the games, e.g. "blitz".
+        :param rules: rules of the games, e.g. "chess".
+        :param eco: ECO code of the opening, e.g. "B20".
+        :param limit: The maximum number of games returned.
+        :returns: List of :obj:`Game` objects.
+        """
+        conditions, params = [], []
+        if username is not None:
+            conditions.append("(white_username = ? OR black_username = ?)")
+            params += [username, username]
+        if since is not None:
+            conditions.append("end_time >= ?")
+            params.append(_to_timestamp(since))
+        if until is not None:
+            conditions.append("end_time <= ?")
+            params.append(_to_timestamp(until))
+        for column, value in (
+            ("time_class", time_class),
+            ("rules", rules),
+            ("eco_code", eco),
+        ):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+
+        sql = SELECT_GAMES
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY end_time, uuid"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+
+        return [self._to_game(row) for row in rows]
+
+    def count(self) -> int:
+        """
+        Returns the number of stored games.
+        """
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+
+    def sync(self, client, username: str, **request_options) -> int:
+        """
+        Downloads the games of a player that are not stored yet.
+        See :func:`sync_player`.
+
+        :param client: A synchronous :obj:`chessdotcom.client.ChessDotComClient`.
+        :param username: username of the player.
+        :returns: Number of games added.
+        """
+        return sync_player(username, self, client=client, **request_options)
+
+    def get_watermark(self, username: str) -> Tuple[Optional[str], Optional[int]]:
+        """
+        Returns the last completed archive month stored for a player, e.g. ``"2020/05"``,
+        and the end time of the player's last stored game in epoch format.
+        Both are None if the player was never synced.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT last_month, last_end_time FROM watermarks WHERE username = ?",
+                (username,),
+            ).fetchone()
+
+        return row or (None, None)
+
+    def set_watermark(
+        self, username: str, last_month: Optional[str], last_end_time: Optional[int]
+    ) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO watermarks (username, last_month, last_end_time) "
+                "VALUES (?, ?, ?)",
+                (username, last_month, last_end_time),
+            )
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @staticmethod
+    def _to_row(game):
+        accuracies = game.accuracies
+
+        row = [
+            game.uuid,
+            game.url,
+            game.pgn,
+            game.time_control,
+            game.start_time,
+            game.end_time,
+            accuracies.white if accuracies else None,
+            accuracies.black if accuracies else None,
+            game.tcn,
+            game.initial_setup,
+            game.fen,
+            game.time_class,
+            game.rules,
+            game.eco,
+            get_tag(game.pgn, "ECO"),
+        ]
+        for player in (game.white, game.black):
+            row += [getattr(player, name, None) for name in PLAYER_COLUMNS]
+
+        return row
+
+    @staticmethod
+    def _to_game(row):
+        values = dict(zip((name for name, _ in COLUMNS), row))
+
+        def build_player(color):
+            stats = {name: values[f"{color}_{name}"] for name in PLAYER_COLUMNS}
+            return (
+                PlayerStats(**stats)
+                if any(v is not None for v in stats.values())
+                else None
+            )
+
+        accuracies = None
+        if (
+            values["accuracies_white"] is not None
+            or values["accuracies_black"] is not None
+        ):
+            accuracies = Accuracies(
+                white=values["accuracies_white"], black=values["accuracies_black"]
+            )
+
+        return Game(
+            url=values["url"],
+            pgn=values["pgn"],
+            time_control=values["time_control"],
+            start_time=values["start_time"],
+            end_time=values["end_time"],
+            accuracies=accuracies,
+            tcn=values["tcn"],
+            uuid=values["uuid"],
+            initial_setup=values["initial_setup"],
+            fen=values["fen"],
+            time_class=values["time_class"],
+            rules=values["rules"],
+            eco=values["eco"],
+            white=build_player("white"),
+            black=build_player("black"),
+        )
+
+
+def sync_player(username: str, store: GameStore, client=None, **request_options) -> int:
+    """
+    Downloads the games of a player that are not in the store yet.
+    The store remembers the player's last completed archive month and the end time
+    of the last game, so only the archives of the months after the watermark
+    (including the current month and a month still in its grace period) are downloaded.
+    Games already in the store are skipped, so games added late to the archive
+    of a previous month are stored too.
+
+    :param username: username of the player.
+    :param store: :obj:`GameStore` the games are added to.
+    :param client: A synchronous :obj:`chessdotcom.client.ChessDotComClient`.
+        The module level endpoint functions are used if None.
+    :returns: Number of games added.
+    """
+    if client is None:
+        from . import endpoints as client
+
+    last_month, last_end_time = store.get_watermark(username)
+    archives = client.get_player_game_archives(username, **request_options)
+
+    added = 0
+    for yyyy, mm in sorted(parse_archive_url(url) for url in archives.archives):
+        month = f"{yyyy}/{mm}"
+        if last_month is not None and month <= last_month:
+            continue
+
+        response = client.get_player_games_by_month(
+            username, year=yyyy, month=mm, **request_options
+        )
+        games = response.games
+        added += store.add_games(games)
+
+        end_times = [game.end_time for game in games if game.end_time]
+        if end_times:
+            last_end_time = max(end_times + [last_end_time or 0])
+        if is_month_completed(yyyy, mm):
+            last_month = month
+
+        store.set_watermark(username, last_month, last_end_time)
+
+    return added
+
+
+def _to_timestamp(datetime_obj):
+    if datetime_obj.tzinfo is None:
+        datetime_obj = datetime_obj.replace(tzinfo=timezone.utc)
+
+    return int(datetime_obj.timestamp())
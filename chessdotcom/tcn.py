@@ -0,0 +1,187 @@
+"""
+Tools for decoding TCN, the compact move encoding of :obj:`Game.tcn`.
+
+Every move takes two characters: the origin square and the target square.
+Squares are numbered from 0 (a1) to 63 (h8) as ``file + 8 * rank``.
+Promotions are encoded in the target character and piece drops
+(e.g. in crazyhouse) in the origin character.
+"""
+
+import re
+from array import array
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+from .utils import slotted
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!?{~}(^)[_]@#$,./&-*++="
+PIECES = "qnrbkp"
+FILES = "abcdefgh"
+
+_INVALID = 255
+_TABLE = bytearray([_INVALID]) * 256
+for _index, _char in reversed(list(enumerate(ALPHABET))):
+    _TABLE[ord(_char)] = _index
+_TABLE = bytes(_TABLE)
+
+_SPECIAL_TARGET = re.compile(b"[\x40-\xff]")
+_SPECIAL_ORIGIN = re.compile(b"[\x4c-\xff]")
+
+
+@slotted()
+@dataclass(repr=True)
+class TcnMove(object):
+    """
+    :ivar from_square: Index of the origin square, None for drops.
+    :ivar to_square: Index of the target square.
+    :ivar promotion: Piece the pawn is promoted to ("q", "n", "r" or "b").
+    :ivar drop: Piece dropped on the target square.
+    """
+
+    from_square: Optional[int]
+    to_square: int
+    promotion: Optional[str] = None
+    drop: Optional[str] = None
+
+    @property
+    def uci(self) -> str:
+        """
+        The move in UCI notation, e.g. ``"e2e4"``, ``"e7e8q"`` or ``"N@f3"``.
+        """
+        if self.drop:
+            return f"{self.drop.upper()}@{square_name(self.to_square)}"
+
+        return (
+            square_name(self.from_square)
+            + square_name(self.to_square)
+            + (self.promotion or "")
+        )
+
+
+@slotted()
+@dataclass(repr=True)
+class TcnBatch(object):
+    """
+    Moves of many games in flat arrays of unsigned bytes, one item per move.
+    The arrays support the buffer protocol, e.g.
+    ``numpy.frombuffer(batch.to_squares, dtype=numpy.uint8)`` does not copy them.
+
+    :ivar from_squares: Indexes of the origin squares. 255 for drops.
+    :ivar to_squares: Indexes of the target squares.
+    :ivar promotions: 0 if the move is not a promotion,
+        otherwise 1 + the index of the piece in ``PIECES``.
+    :ivar drops: 0 if the move is not a drop,
+        otherwise 1 + the index of the piece in ``PIECES``.
+    :ivar offsets: Moves of the game ``i`` are the items from ``offsets[i]``
+        to ``offsets[i + 1]``. One item longer than the number of games.
+    """
+
+    from_squares: array
+    to_squares: array
+    promotions: array
+    drops: array
+    offsets: array
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def moves(self, index: int) -> List[TcnMove]:
+        """
+        Returns the moves of the game ``index`` as :obj:`TcnMove` objects.
+        """
+        return [
+            _build_move(
+                self.from_squares[i],
+                self.to_squares[i],
+                self.promotions[i],
+                self.drops[i],
+            )
+            for i in range(self.offsets[index], self.offsets[index + 1])
+        ]
+
+
+def square_name(square: int) -> str:
+    """
+    Returns the name of a square index, e.g. ``"e4"`` for 28.
+    """
+    return FILES[square % 8] + str(square // 8 + 1)
+
+
+def decode_tcn(tcn: str) -> List[TcnMove]:
+    """
+    Decodes the TCN of a game.
+
+    :param tcn: TCN string, e.g. :obj:`Game.tcn`.
+    :returns: List of :obj:`TcnMove` objects.
+    :raises ValueError: if the TCN is malformed.
+    """
+    batch = decode_tcn_batch([tcn])
+    return batch.moves(0)
+
+
+def decode_tcn_batch(tcns: Iterable[Optional[str]]) -> TcnBatch:
+    """
+    Decodes the TCN of many games into flat arrays.
+    The whole batch is translated at once and only promotions and drops
+    are decoded move by move.
+
+    :param tcns: Iterable of TCN strings, e.g. ``[game.tcn for game in response.games]``.
+        None counts as a game without moves.
+    :returns: :obj:`TcnBatch` object.
+    :raises ValueError: if a TCN is malformed.
+    """
+    offsets = array("I", [0])
+    chunks = []
+    for tcn in tcns:
+        tcn = tcn or ""
+        if len(tcn) % 2:
+            raise ValueError(f"TCN '{tcn}' has an odd number of characters")
+
+        chunks.append(tcn)
+        offsets.append(offsets[-1] + len(tcn) // 2)
+
+    try:
+        codes = "".join(chunks).encode("ascii").translate(_TABLE)
+    except UnicodeEncodeError as err:
+        raise ValueError("TCN contains characters outside of the alphabet") from err
+    if _INVALID in codes:
+        raise ValueError("TCN contains characters outside of the alphabet")
+
+    from_squares = array("B", codes[0::2])
+    to_squares = array("B", codes[1::2])
+    promotions = array("B", bytes(len(to_squares)))
+    drops = array("B", bytes(len(to_squares)))
+
+    for match in _SPECIAL_TARGET.finditer(codes[1::2]):
+        i = match.start()
+        origin, target = from_squares[i], to_squares[i]
+        promotions[i] = (target - 64) // 3 + 1
+        to_squares[i] = origin + (-8 if origin < 16 else 8) + (target - 1) % 3 - 1
+
+    for match in _SPECIAL_ORIGIN.finditer(codes[0::2]):
+        i = match.start()
+        piece = from_squares[i] - 79
+        if piece < 0:
+            raise ValueError(f"TCN move {i} has an invalid origin square")
+
+        drops[i] = piece + 1
+        from_squares[i] = 255
+
+    return TcnBatch(
+        from_squares=from_squares,
+        to_squares=to_squares,
+        promotions=promotions,
+        drops=drops,
+        offsets=offsets,
+    )
+
+
+def _build_move(from_square, to_square, promotion, drop):
+    if drop:
+        return TcnMove(None, to_square, drop=PIECES[drop - 1])
+
+    return TcnMove(
+        from_square,
+        to_square,
+        promotion=PIECES[promotion - 1] if promotion else None,
+    )
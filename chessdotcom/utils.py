@@ -1,4 +1,5 @@
-from datetime import datetime
+from dataclasses import fields
+from datetime import datetime, timedelta
 from functools import reduce
 from typing import Tuple
 
@@ -31,6 +32,41 @@ def resolve_date(year: str, month: str, date: datetime) -> Tuple[str, str]:
         )
 
 
+def is_month_completed(
+    year: str, month: str, now: datetime = None, grace_period: timedelta = timedelta(1)
+) -> bool:
+    """Returns True if the month has ended, so its archive can not change anymore.
+
+    Parameters:
+        year -- year (yyyy)
+        month -- month (mm)
+        now -- current UTC datetime. Defaults to datetime.utcnow()
+        grace_period -- time after the end of the month during which
+            late games may still be added to its archive
+    """
+
+    year, month = int(year), int(month)
+    next_month = datetime(year + month // 12, month % 12 + 1, 1)
+    now = now or datetime.utcnow()
+
+    return now >= next_month + grace_period
+
+
+def parse_archive_url(url: str) -> Tuple[str, str]:
+    """Returns 'yyyy' and 'mm' of a monthly archive URL
+    as listed by the game archives endpoint.
+
+    Parameters:
+        url -- archive URL ending with '/yyyy/mm'
+    """
+
+    yyyy, mm = url.rstrip("/").split("/")[-2:]
+    if not (yyyy.isdigit() and mm.isdigit()):
+        raise ValueError(f"'{url}' is not a monthly archive URL")
+
+    return yyyy, mm.zfill(2)
+
+
 def from_timestamp(timestamp):
     return datetime.utcfromtimestamp(timestamp) if timestamp else None
 
@@ -41,3 +77,25 @@ def dig(data, keys, default=None):
         keys,
         data,
     )
+
+
+def slotted(*attributes):
+    """Class decorator replacing a dataclass with an identical class
+    that stores its fields in __slots__ instead of a per-instance __dict__.
+    Must be applied on top of @dataclass.
+
+    Parameters:
+        attributes -- names of the attributes set outside of the fields,
+            e.g. in __post_init__
+    """
+
+    def wrap(cls):
+        slots = tuple(field.name for field in fields(cls)) + attributes
+        namespace = dict(cls.__dict__)
+        for name in slots + ("__dict__", "__weakref__"):
+            namespace.pop(name, None)
+        namespace["__slots__"] = slots
+
+        return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+    return wrap
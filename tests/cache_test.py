@@ -0,0 +1,143 @@
+import math
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from chessdotcom.cache import CacheEntry, FileCache, MemoryCache, SQLiteCache
+from chessdotcom.client import ChessDotComClient
+
+
+@pytest.fixture(params=["memory", "sqlite", "file"])
+def make_cache(request, tmp_path):
+    def make_cache(**kwargs):
+        if request.param == "sqlite":
+            return SQLiteCache(str(tmp_path / "cache.sqlite"), **kwargs)
+        if request.param == "file":
+            return FileCache(str(tmp_path / "cache"), **kwargs)
+        return MemoryCache(**kwargs)
+
+    return make_cache
+
+
+def test_cache_entry_from_response():
+    entry = CacheEntry.from_response(
+        "{}", {"ETag": '"abc"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    )
+
+    assert entry.content == "{}"
+    assert entry.conditional_headers() == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+    }
+    assert entry.is_fresh() is False
+
+    assert CacheEntry.from_response("{}", {"ETag": '"abc"'}).conditional_headers() == {
+        "If-None-Match": '"abc"'
+    }
+    assert CacheEntry.from_response("{}", {}) is None
+
+
+def test_cache_entry_ttl():
+    entry = CacheEntry.from_response("{}", {}, ttl=300)
+
+    assert entry.is_fresh() is True
+    assert entry.can_revalidate() is False
+
+    entry = CacheEntry.from_response("{}", {}, ttl=None)
+
+    assert entry.expires_at == math.inf
+    assert entry.is_fresh() is True
+
+
+def test_cache(make_cache):
+    cache = make_cache()
+    entry = CacheEntry("{}", etag='"abc"', expires_at=math.inf)
+
+    assert cache.get("url") is None
+
+    cache.set("url", entry)
+    stored = cache.get("url")
+    assert stored.content == "{}"
+    assert stored.etag == '"abc"'
+    assert stored.last_modified is None
+    assert stored.expires_at == math.inf
+
+    cache.set("binary", CacheEntry(b"{}"))
+    assert cache.get("binary").content == b"{}"
+
+    cache.delete("url")
+    assert cache.get("url") is None
+
+    cache.set("url", entry)
+    cache.clear()
+    assert cache.get("url") is None
+    assert cache.get("binary") is None
+
+
+@patch("chessdotcom.cache.time.time")
+def test_cache_lru_eviction(time_mock, make_cache):
+    cache = make_cache(max_size=2)
+
+    time_mock.return_value = 1
+    cache.set("first", CacheEntry("1"))
+    time_mock.return_value = 2
+    cache.set("second", CacheEntry("2"))
+    time_mock.return_value = 3
+    cache.get("first")
+    time_mock.return_value = 4
+    cache.set("third", CacheEntry("3"))
+
+    assert cache.get("first") is not None
+    assert cache.get("second") is None
+    assert cache.get("third") is not None
+
+
+def test_cache_endpoint_ttls():
+    cache = MemoryCache(ttl=60, endpoint_ttls={"get_leaderboards": 300})
+
+    assert cache.get_ttl("get_leaderboards") == 300
+    assert cache.get_ttl("get_player_profile") == 60
+
+
+@patch("chessdotcom.client.requests.Session.get")
+def test_client_serves_fresh_entries(mock_session_get, make_cache):
+    mock_session_get.return_value = MagicMock(
+        status_code=200, text='{"leaderboards": {}}', headers={}
+    )
+    cache = make_cache(endpoint_ttls={"get_leaderboards": 300})
+
+    with ChessDotComClient(cache=cache) as client:
+        first = client.get_leaderboards()
+        second = client.get_leaderboards()
+        client.get_player_profile("hikaru")
+        client.get_player_profile("hikaru")
+
+    assert first.json == second.json
+    assert mock_session_get.call_count == 3
+    assert cache.hits == 1
+    assert cache.misses == 3
+
+
+@patch("chessdotcom.client.requests.Session.get")
+def test_client_keeps_completed_months(mock_session_get, make_cache):
+    mock_session_get.return_value = MagicMock(
+        status_code=200, text='{"games": []}', headers={}
+    )
+    cache = make_cache()
+    current_month = datetime.utcnow()
+
+    with ChessDotComClient(cache=cache) as client:
+        client.get_player_games_by_month("hikaru", year=2020, month=5)
+        client.get_player_games_by_month("hikaru", year=2020, month=5)
+        client.get_player_games_by_month_pgn("hikaru", year=2020, month=5)
+        client.get_player_games_by_month_pgn("hikaru", year=2020, month=5)
+        client.get_player_games_by_month("hikaru", datetime_obj=current_month)
+        client.get_player_games_by_month("hikaru", datetime_obj=current_month)
+
+    assert mock_session_get.call_count == 4
+    assert cache.hits == 2
+    assert (
+        cache.get("https://api.chess.com/pub/player/hikaru/games/2020/05").expires_at
+        == math.inf
+    )
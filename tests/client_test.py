@@ -1,10 +1,23 @@
+import asyncio
 import json
-from unittest.mock import MagicMock, patch
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import partial
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from chessdotcom.client import ChessDotComClient, Client, RateLimitHandler, Resource
-from chessdotcom.errors import ChessDotComClientError
+from chessdotcom.cache import MemoryCache
+from chessdotcom.client import (
+    ChessDotComClient,
+    Client,
+    ConnectionConfig,
+    RateLimiter,
+    RateLimitHandler,
+    Resource,
+)
+from chessdotcom.endpoints import player_games_by_month
+from chessdotcom.errors import ChessDotComClientError, ChessDotComDecodingError
 from tests.support.aio_mock_response import AioMockResponse
 
 
@@ -35,10 +48,140 @@ def test_rate_limit_handler(sleep_mock):
     )
 
 
+def test_rate_limit_handler_backoff():
+    handler = RateLimitHandler(tts=2, retries=5, backoff_factor=2, max_tts=10)
+
+    assert handler.get_tts(Resource(times_requested=1)) == 2
+    assert handler.get_tts(Resource(times_requested=2)) == 4
+    assert handler.get_tts(Resource(times_requested=3)) == 8
+    assert handler.get_tts(Resource(times_requested=4)) == 10
+
+
+@patch("chessdotcom.client.random.uniform")
+def test_rate_limit_handler_jitter(mock_uniform):
+    mock_uniform.return_value = 0.5
+    handler = RateLimitHandler(tts=2, jitter=1)
+
+    assert handler.get_tts(Resource(times_requested=1)) == 2.5
+    mock_uniform.assert_called_once_with(0, 1)
+
+
+def test_rate_limit_handler_retry_after():
+    handler = RateLimitHandler(tts=2)
+
+    assert handler.get_tts(Resource(times_requested=1), {"Retry-After": "7"}) == 7
+    assert handler.get_tts(Resource(times_requested=1), {"Retry-After": "1"}) == 2
+    assert (
+        handler.get_tts(
+            Resource(times_requested=1),
+            {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"},
+        )
+        == 2
+    )
+    assert handler.get_tts(Resource(times_requested=1), {"Retry-After": "?"}) == 2
+
+    handler = RateLimitHandler(tts=2, respect_retry_after=False)
+
+    assert handler.get_tts(Resource(times_requested=1), {"Retry-After": "7"}) == 2
+
+
+@pytest.mark.asyncio
+@patch("chessdotcom.client.time.sleep")
+@patch("chessdotcom.client.asyncio.sleep")
+async def test_rate_limit_handler_async(asyncio_sleep_mock, sleep_mock):
+    handler = RateLimitHandler(retries=1, tts=4)
+
+    assert (
+        await handler.should_try_again_async(
+            status_code=429, resource=Resource(times_requested=1)
+        )
+        is True
+    )
+    asyncio_sleep_mock.assert_awaited_once_with(4)
+    sleep_mock.assert_not_called()
+
+    assert (
+        await handler.should_try_again_async(
+            status_code=429, resource=Resource(times_requested=2)
+        )
+        is False
+    )
+
+
+@pytest.mark.asyncio
+@patch("chessdotcom.client.time.sleep")
+@patch("chessdotcom.client.asyncio.sleep")
+@patch("chessdotcom.client.ClientSession.get")
+async def test_do_get_request_async_retries_without_blocking(
+    mock_session_get, asyncio_sleep_mock, sleep_mock
+):
+    mock_session_get.side_effect = [
+        AioMockResponse(text="{}", status=429, headers={"Retry-After": "3"}),
+        AioMockResponse(text="{}", status=200),
+    ]
+
+    async with ChessDotComClient(
+        aio=True, rate_limit_handler=RateLimitHandler(tts=1, retries=1)
+    ) as client:
+        response = await client.do_get_request(
+            Resource(uri="/player/fabianocaruana", tts=2)
+        )
+
+    assert response.json == {}
+    assert [c.args for c in asyncio_sleep_mock.await_args_list] == [(2,), (3,)]
+    sleep_mock.assert_not_called()
+
+
+@patch("chessdotcom.client.time.sleep")
+@patch("chessdotcom.client.time.monotonic")
+def test_rate_limiter(monotonic_mock, sleep_mock):
+    monotonic_mock.return_value = 100
+    limiter = RateLimiter(rate=2, burst=2)
+
+    limiter.acquire()
+    limiter.acquire()
+    sleep_mock.assert_not_called()
+
+    limiter.acquire()
+    sleep_mock.assert_called_once_with(0.5)
+
+    limiter.acquire()
+    sleep_mock.assert_called_with(1)
+
+    monotonic_mock.return_value = 110
+    sleep_mock.reset_mock()
+
+    limiter.acquire()
+    sleep_mock.assert_not_called()
+
+
+def test_rate_limiter_validation():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+
+    with pytest.raises(ValueError):
+        RateLimiter(rate=1, burst=0)
+
+
+@pytest.mark.asyncio
+@patch("chessdotcom.client.asyncio.sleep")
+@patch("chessdotcom.client.ClientSession.get")
+async def test_do_get_request_async_rate_limiter(mock_session_get, asyncio_sleep_mock):
+    mock_session_get.return_value = AioMockResponse(text="{}", status=200)
+    limiter = RateLimiter(rate=1, burst=1)
+
+    async with ChessDotComClient(aio=True, rate_limiter=limiter) as client:
+        await client.do_get_request(Resource(uri="/player/fabianocaruana"))
+        await client.do_get_request(Resource(uri="/player/hikaru"))
+
+    asyncio_sleep_mock.assert_awaited_once()
+    assert 0 < asyncio_sleep_mock.await_args.args[0] <= 1
+
+
 @patch("chessdotcom.client.requests")
 def test_do_get_request_sync(mock_requests):
     mock_data = {"name": "fabianocaruana"}
-    mock_requests.get.return_value = MagicMock(
+    mock_requests.Session.return_value.get.return_value = MagicMock(
         status_code=200, text=json.dumps(mock_data)
     )
 
@@ -49,7 +192,7 @@ def test_do_get_request_sync(mock_requests):
         )
     )
 
-    assert mock_requests.get.called_once_with(
+    assert mock_requests.Session.return_value.get.called_once_with(
         url="https://api.chess.com/player/fabianocaruana",
         headers={},
         timeout=30,
@@ -60,7 +203,7 @@ def test_do_get_request_sync(mock_requests):
 @patch("chessdotcom.client.requests")
 def test_do_get_request_sync_error(mock_requests):
     mock_data = {"message": "does not exist"}
-    mock_requests.get.return_value = MagicMock(
+    mock_requests.Session.return_value.get.return_value = MagicMock(
         status_code=404,
         text=json.dumps(mock_data),
         headers={"Content-Type": "application/json"},
@@ -75,7 +218,7 @@ def test_do_get_request_sync_error(mock_requests):
             )
         )
 
-    assert mock_requests.get.called_once_with(
+    assert mock_requests.Session.return_value.get.called_once_with(
         url="https://api.chess.com/player/fabianocaruana",
         headers={},
         timeout=30,
@@ -148,9 +291,93 @@ async def test_do_get_request_async_error(mock_session_get):
     )
 
 
+@patch("chessdotcom.client.requests.Session.get")
+def test_sync_client_reuses_session(mock_session_get):
+    mock_session_get.return_value = MagicMock(status_code=200, text="{}")
+
+    with ChessDotComClient() as client:
+        client.do_get_request(Resource(uri="/player/fabianocaruana"))
+        session = client._sync_session
+
+        client.do_get_request(Resource(uri="/player/hikaru"))
+
+        assert client._sync_session is session
+        assert mock_session_get.call_count == 2
+
+    assert client._sync_session is None
+
+
+def test_sync_client_connection_config():
+    client = ChessDotComClient(
+        connection_config=ConnectionConfig(
+            pool_connections=2, pool_maxsize=32, pool_block=True
+        ),
+    )
+
+    with client:
+        adapter = client._get_sync_session().get_adapter("https://api.chess.com")
+
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 32
+        assert adapter._pool_block is True
+
+
+@pytest.mark.asyncio
+@patch("chessdotcom.client.ClientSession.get")
+async def test_async_client_reuses_session(mock_session_get):
+    mock_session_get.return_value = AioMockResponse(text="{}", status=200)
+
+    async with ChessDotComClient(aio=True) as client:
+        await client.do_get_request(Resource(uri="/player/fabianocaruana"))
+        session = client._async_session
+
+        await client.do_get_request(Resource(uri="/player/hikaru"))
+
+        assert client._async_session is session
+        assert mock_session_get.call_count == 2
+
+    assert session.closed
+    assert client._async_session is None
+
+
+@patch("chessdotcom.client.ClientSession.get")
+def test_async_client_releases_session_of_previous_loop(mock_session_get):
+    mock_session_get.return_value = AioMockResponse(text="{}", status=200)
+    client = ChessDotComClient(aio=True)
+
+    async def get_profile():
+        await client.get_player_profile("hikaru")
+        return client._async_session
+
+    first = asyncio.run(get_profile())
+    second = asyncio.run(get_profile())
+
+    assert first is not second
+    assert first.closed and not second.closed
+
+    asyncio.run(client.close())
+    assert second.closed
+
+
+@pytest.mark.asyncio
+async def test_async_client_connection_config():
+    client = ChessDotComClient(
+        aio=True,
+        connection_config=ConnectionConfig(
+            pool_size=5, pool_size_per_host=2, dns_cache_ttl=60
+        ),
+    )
+
+    async with client:
+        connector = client._get_async_session().connector
+
+        assert connector.limit == 5
+        assert connector.limit_per_host == 2
+
+
 @patch("chessdotcom.client.requests")
 def test_do_get_request_sync_decoding_error(mock_requests):
-    mock_requests.get.return_value = MagicMock(
+    mock_requests.Session.return_value.get.return_value = MagicMock(
         status_code=200,
         text='{"key": ',
     )
@@ -167,7 +394,9 @@ def test_do_get_request_sync_decoding_error(mock_requests):
 def test_do_get_request_sync_combined_headers(mock_requests):
     client = ChessDotComClient(request_config={"headers": {"header": "value"}})
 
-    mock_requests.get.return_value = MagicMock(status_code=200, text="{}")
+    mock_requests.Session.return_value.get.return_value = MagicMock(
+        status_code=200, text="{}"
+    )
 
     client.do_get_request(
         Resource(
@@ -176,7 +405,7 @@ def test_do_get_request_sync_combined_headers(mock_requests):
         )
     )
 
-    assert mock_requests.get.called_once_with(
+    assert mock_requests.Session.return_value.get.called_once_with(
         url="https://api.chess.com/player/fabianocaruana",
         headers={"headers": {"header": "override_value"}},
         timeout=30,
@@ -187,7 +416,9 @@ def test_do_get_request_sync_combined_headers(mock_requests):
 def test_do_get_request_includes_user_agent_header(mock_requests):
     client = ChessDotComClient(user_agent="My Python Application. Contact me at...")
 
-    mock_requests.get.return_value = MagicMock(status_code=200, text='{"key": "value"}')
+    mock_requests.Session.return_value.get.return_value = MagicMock(
+        status_code=200, text='{"key": "value"}'
+    )
 
     client.do_get_request(
         Resource(
@@ -196,7 +427,7 @@ def test_do_get_request_includes_user_agent_header(mock_requests):
         )
     )
 
-    assert mock_requests.get.called_once_with(
+    assert mock_requests.Session.return_value.get.called_once_with(
         url="https://api.chess.com/player/fabianocaruana",
         headers={"headers": {"User-Agent": "My Python Application. Contact me at..."}},
         timeout=30,
@@ -254,3 +485,441 @@ def test_verify_ssl_option():
     client = ChessDotComClient(verify_ssl=False)
 
     assert client.request_config["verify"] is False
+
+
+@pytest.mark.asyncio
+@patch("chessdotcom.client.ClientSession.get")
+async def test_fetch_many_async(mock_session_get):
+    def get(url, **kwargs):
+        if url.endswith("/missing"):
+            return AioMockResponse(text="{}", status=404)
+        return AioMockResponse(text=json.dumps({"url": url}), status=200)
+
+    mock_session_get.side_effect = get
+
+    async with ChessDotComClient(aio=True) as client:
+        responses = await client.fetch_many(
+            [
+                client.do_get_request(Resource(uri="/player/fabianocaruana")),
+                partial(client.do_get_request, Resource(uri="/player/missing")),
+                client.do_get_request(Resource(uri="/player/hikaru")),
+            ],
+            concurrency=2,
+        )
+
+    assert responses[0].json == {
+        "url": "https://api.chess.com/pub/player/fabianocaruana"
+    }
+    assert isinstance(responses[1], ChessDotComClientError)
+    assert responses[1].status_code == 404
+    assert responses[2].json == {"url": "https://api.chess.com/pub/player/hikaru"}
+
+
+@pytest.mark.asyncio
+async def test_fetch_many_async_concurrency():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def call():
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return in_flight
+
+    client = ChessDotComClient(aio=True)
+    results = [
+        index
+        async for index, _ in client.fetch_many(
+            [call for _ in range(10)], concurrency=3, as_completed=True
+        )
+    ]
+
+    assert max_in_flight == 3
+    assert sorted(results) == list(range(10))
+
+
+@patch("chessdotcom.client.requests.Session.get")
+def test_fetch_many_sync(mock_session_get):
+    def get(url, **kwargs):
+        if url.endswith("/missing"):
+            return MagicMock(status_code=404, text="{}")
+        return MagicMock(status_code=200, text=json.dumps({"url": url}))
+
+    mock_session_get.side_effect = get
+
+    with ChessDotComClient() as client:
+        calls = [
+            partial(client.do_get_request, Resource(uri=f"/player/{username}"))
+            for username in ("fabianocaruana", "missing", "hikaru")
+        ]
+        responses = client.fetch_many(calls, concurrency=2)
+        completed = dict(client.fetch_many(calls, as_completed=True))
+
+    assert responses[0].json == {
+        "url": "https://api.chess.com/pub/player/fabianocaruana"
+    }
+    assert isinstance(responses[1], ChessDotComClientError)
+    assert responses[2].json == {"url": "https://api.chess.com/pub/player/hikaru"}
+    assert sorted(completed) == [0, 1, 2]
+    assert isinstance(completed[1], ChessDotComClientError)
+
+
+def test_fetch_many_concurrency_validation():
+    with pytest.raises(ValueError):
+        ChessDotComClient().fetch_many([], concurrency=0)
+
+
+ARCHIVES = [
+    "https://api.chess.com/pub/player/fabianocaruana/games/2020/06",
+    "https://api.chess.com/pub/player/fabianocaruana/games/2020/04",
+    "https://api.chess.com/pub/player/fabianocaruana/games/2020/05",
+    "https://api.chess.com/pub/player/fabianocaruana/games/2021/01",
+]
+
+
+def games_by_month(username, year, month, **request_options):
+    return MagicMock(games=[f"{year}/{month}/1", f"{year}/{month}/2"])
+
+
+def test_iter_player_games():
+    client = ChessDotComClient()
+    client.get_player_game_archives = MagicMock(
+        return_value=MagicMock(archives=ARCHIVES)
+    )
+    client.get_player_games_by_month = MagicMock(side_effect=games_by_month)
+
+    games = list(client.iter_player_games("fabianocaruana", concurrency=2))
+
+    assert games == [
+        "2020/04/1",
+        "2020/04/2",
+        "2020/05/1",
+        "2020/05/2",
+        "2020/06/1",
+        "2020/06/2",
+        "2021/01/1",
+        "2021/01/2",
+    ]
+
+
+def test_iter_player_games_since_until():
+    client = ChessDotComClient()
+    client.get_player_game_archives = MagicMock(
+        return_value=MagicMock(archives=ARCHIVES)
+    )
+    client.get_player_games_by_month = MagicMock(side_effect=games_by_month)
+
+    games = list(
+        client.iter_player_games(
+            "fabianocaruana",
+            since=datetime(2020, 5, 20),
+            until=datetime(2020, 12, 1),
+        )
+    )
+
+    assert games == ["2020/05/1", "2020/05/2", "2020/06/1", "2020/06/2"]
+    assert client.get_player_games_by_month.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_iter_player_games_async():
+    async def games_by_month_async(username, year, month, **request_options):
+        await asyncio.sleep(0.01 if month == "04" else 0)
+        return games_by_month(username, year, month)
+
+    client = ChessDotComClient(aio=True)
+    client.get_player_game_archives = AsyncMock(
+        return_value=MagicMock(archives=ARCHIVES)
+    )
+    client.get_player_games_by_month = games_by_month_async
+
+    games = [
+        game
+        async for game in client.iter_player_games(
+            "fabianocaruana", since=datetime(2020, 5, 1), concurrency=3
+        )
+    ]
+
+    assert games == [
+        "2020/05/1",
+        "2020/05/2",
+        "2020/06/1",
+        "2020/06/2",
+        "2021/01/1",
+        "2021/01/2",
+    ]
+
+
+@patch("chessdotcom.client.requests.Session.get")
+def test_do_get_request_sync_conditional_cache(mock_session_get):
+    mock_session_get.side_effect = [
+        MagicMock(status_code=200, text='{"name": "hikaru"}', headers={"ETag": "v1"}),
+        MagicMock(status_code=304, text="", headers={"ETag": "v1"}),
+    ]
+    cache = MemoryCache()
+
+    with ChessDotComClient(cache=cache) as client:
+        first = client.do_get_request(Resource(uri="/player/hikaru"))
+        second = client.do_get_request(Resource(uri="/player/hikaru"))
+
+    assert first.json == second.json == {"name": "hikaru"}
+    assert "If-None-Match" not in mock_session_get.call_args_list[0].kwargs["headers"]
+    assert mock_session_get.call_args_list[1].kwargs["headers"]["If-None-Match"] == "v1"
+    assert cache.get("https://api.chess.com/pub/player/hikaru").etag == "v1"
+
+
+@pytest.mark.asyncio
+@patch("chessdotcom.client.ClientSession.get")
+async def test_do_get_request_async_conditional_cache(mock_session_get):
+    mock_session_get.side_effect = [
+        AioMockResponse(
+            text='{"name": "hikaru"}',
+            status=200,
+            headers={"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"},
+        ),
+        AioMockResponse(text="", status=304),
+    ]
+
+    async with ChessDotComClient(aio=True, cache=MemoryCache()) as client:
+        first = await client.do_get_request(Resource(uri="/player/hikaru"))
+        second = await client.do_get_request(Resource(uri="/player/hikaru"))
+
+    assert first.json == second.json == {"name": "hikaru"}
+    assert (
+        mock_session_get.call_args_list[1].kwargs["headers"]["If-Modified-Since"]
+        == "Wed, 21 Oct 2015 07:28:00 GMT"
+    )
+
+
+@patch("chessdotcom.client.requests.Session.get")
+def test_lazy_client_builds_models_on_access(mock_session_get):
+    mock_session_get.return_value = MagicMock(
+        status_code=200,
+        text='{"games": [{"uuid": "1", "white": {"username": "hikaru"}}]}',
+        headers={},
+    )
+    builder = player_games_by_month.ResponseBuilder
+
+    with patch.object(
+        builder, "_build_games", autospec=True, side_effect=builder._build_games
+    ) as build_games_mock, ChessDotComClient(lazy=True) as client:
+        response = client.get_player_games_by_month("hikaru", year=2020, month=5)
+
+        assert response.json["games"][0]["uuid"] == "1"
+        assert build_games_mock.call_count == 0
+
+        games = response.games
+        assert games[0].white.username == "hikaru"
+        assert response.games is games
+        assert build_games_mock.call_count == 1
+
+    with pytest.raises(AttributeError):
+        response.leaderboards
+
+
+@patch("chessdotcom.client.requests.Session.get")
+def test_client_json_backend(mock_session_get):
+    mock_session_get.return_value = MagicMock(
+        status_code=200, text='{"name": "hikaru"}', headers={}
+    )
+    resource = Resource(uri="/player/hikaru")
+
+    with ChessDotComClient(json_backend="json") as client:
+        response = client.do_get_request(resource)
+
+    assert response.json == {"name": "hikaru"}
+    assert resource.response_builder.serializer is client.serializer
+    assert client.serializer.backend == "json"
+
+
+@patch("chessdotcom.client.requests.Session.get")
+def test_client_decode_bytes(mock_session_get):
+    mock_session_get.return_value = MagicMock(
+        status_code=200, content=b'{"name": "hikaru"}', headers={}
+    )
+
+    with ChessDotComClient(decode_bytes=True) as client:
+        response = client.do_get_request(Resource(uri="/player/hikaru"))
+
+    assert response.json == {"name": "hikaru"}
+    assert response.text is None
+
+
+@pytest.mark.asyncio
+@patch("chessdotcom.client.ClientSession.get")
+async def test_async_client_decode_bytes(mock_session_get):
+    mock_session_get.return_value = AioMockResponse(
+        text='{"games": [{"uuid": "1"}]}', status=200
+    )
+
+    async with ChessDotComClient(aio=True, decode_bytes=True) as client:
+        response = await client.get_player_games_by_month("hikaru", year=2020, month=5)
+
+    assert response.games[0].uuid == "1"
+    assert response.text is None
+
+
+@pytest.mark.parametrize(
+    "retain, has_text, has_json",
+    [
+        ("all", True, True),
+        ("text", True, False),
+        ("json", False, True),
+        ("models", False, False),
+    ],
+)
+@patch("chessdotcom.client.requests.Session.get")
+def test_client_retain(mock_session_get, retain, has_text, has_json):
+    text = '{"games": [{"uuid": "1"}]}'
+    mock_session_get.return_value = MagicMock(status_code=200, text=text, headers={})
+
+    with ChessDotComClient(retain=retain) as client:
+        response = client.get_player_games_by_month("hikaru", year=2020, month=5)
+
+    assert response.games[0].uuid == "1"
+    assert response.text == (text if has_text else None)
+    assert response.json == (json.loads(text) if has_json else None)
+
+
+def test_client_retain_validation():
+    with pytest.raises(ValueError):
+        ChessDotComClient(retain="everything")
+
+
+@pytest.mark.asyncio
+@patch("chessdotcom.client.ClientSession.get")
+async def test_async_client_coalesces_identical_requests(mock_session_get):
+    class SlowResponse(AioMockResponse):
+        async def __aenter__(self):
+            await asyncio.sleep(0)
+            return self
+
+    mock_session_get.side_effect = lambda **kwargs: SlowResponse(
+        text='{"username": "hikaru"}', status=200
+    )
+
+    async with ChessDotComClient(aio=True, coalesce=True) as client:
+        responses = await asyncio.gather(
+            *(client.get_player_profile("hikaru") for _ in range(5)),
+            client.get_player_profile("fabianocaruana"),
+        )
+        assert client._in_flight == {}
+
+        await client.get_player_profile("hikaru")
+
+    assert all(response is responses[0] for response in responses[:5])
+    assert responses[0].player.username == "hikaru"
+    assert mock_session_get.call_count == 3
+
+
+def count_games(response):
+    return len(response.games)
+
+
+@pytest.mark.asyncio
+@patch("chessdotcom.client.ClientSession.get")
+async def test_async_client_coalesces_requests_by_transform(mock_session_get):
+    class SlowResponse(AioMockResponse):
+        async def __aenter__(self):
+            await asyncio.sleep(0)
+            return self
+
+    mock_session_get.side_effect = lambda **kwargs: SlowResponse(
+        text='{"games": [{"uuid": "1"}, {"uuid": "2"}]}', status=200
+    )
+
+    async with ChessDotComClient(aio=True, coalesce=True) as client:
+        first, second, third = await asyncio.gather(
+            client.get_player_games_by_month("hikaru", year=2020, month=1),
+            client.get_player_games_by_month(
+                "hikaru", year=2020, month=1, transform=count_games
+            ),
+            client.get_player_games_by_month(
+                "hikaru", year=2020, month=1, transform=count_games
+            ),
+        )
+
+    assert first.games[1].uuid == "2"
+    assert second == third == 2
+    assert mock_session_get.call_count == 2
+
+
+@patch("chessdotcom.client.requests.Session.get")
+def test_client_executor(mock_session_get):
+    text = '{"games": [{"uuid": "1", "white": {"username": "hikaru"}}, {"uuid": "2"}]}'
+    mock_session_get.return_value = MagicMock(status_code=200, text=text, headers={})
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        with ChessDotComClient(executor=executor, retain="models") as client:
+            response = client.get_player_games_by_month("hikaru", year=2020, month=5)
+            count = client.get_player_games_by_month(
+                "hikaru", year=2020, month=5, transform=count_games
+            )
+
+    assert response.games[0].white.username == "hikaru"
+    assert response.text is None and response.json is None
+    assert count == 2
+
+
+@pytest.mark.asyncio
+@patch("chessdotcom.client.ClientSession.get")
+async def test_async_client_executor(mock_session_get):
+    mock_session_get.side_effect = lambda url, **kwargs: AioMockResponse(
+        text=json.dumps({"games": [{"uuid": url[-2:]}] * int(url[-1])}), status=200
+    )
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        async with ChessDotComClient(aio=True, executor=executor) as client:
+            counts = await asyncio.gather(
+                *(
+                    client.get_player_games_by_month(
+                        "hikaru", year=2020, month=month, transform=count_games
+                    )
+                    for month in range(1, 6)
+                )
+            )
+
+    assert counts == [1, 2, 3, 4, 5]
+
+
+def test_iter_player_archives():
+    client = ChessDotComClient()
+    client.get_player_game_archives = MagicMock(
+        return_value=MagicMock(archives=ARCHIVES)
+    )
+    client.get_player_games_by_month = MagicMock(
+        side_effect=lambda username, year, month, transform, **request_options: (
+            transform(games_by_month(username, year, month))
+        )
+    )
+
+    counts = list(
+        client.iter_player_archives(
+            "fabianocaruana", concurrency=2, transform=count_games
+        )
+    )
+
+    assert counts == [2, 2, 2, 2]
+    assert [c.kwargs["month"] for c in client.get_player_games_by_month.mock_calls] == [
+        "04",
+        "05",
+        "06",
+        "01",
+    ]
+
+
+@patch("chessdotcom.client.requests.Session.get")
+def test_client_executor_decoding_error(mock_session_get):
+    mock_session_get.return_value = MagicMock(
+        status_code=200, text="{not json", headers={}
+    )
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        with ChessDotComClient(executor=executor) as client:
+            with pytest.raises(ChessDotComDecodingError) as err:
+                client.get_player_games_by_month("hikaru", year=2020, month=5)
+
+    assert err.value.text == "{not json"
+    assert str(err.value) == "Response could not be converted to JSON"
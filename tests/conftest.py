@@ -1,4 +1,5 @@
 import pytest
+import pytest_asyncio
 
 from chessdotcom import ChessDotComClient, Client
 from chessdotcom import endpoints as _endpoints
@@ -19,8 +20,14 @@ def client():
 
 
 @pytest.fixture
-def async_client():
-    return ChessDotComClient(aio=True)
+def typed_client():
+    return ChessDotComClient(aio=False, typed=True)
+
+
+@pytest_asyncio.fixture
+async def async_client():
+    async with ChessDotComClient(aio=True) as client:
+        yield client
 
 
 @pytest.fixture
@@ -1,5 +1,6 @@
 import pytest
 
+from chessdotcom.pgn import PgnGame
 from tests.vcr import vcr
 
 
@@ -42,3 +43,33 @@ def validate_response(response):
 
     assert isinstance(response.pgn.pgn, str)
     assert isinstance(response.pgn.data, str)
+
+
+@vcr.use_cassette("get_player_games_by_month_pgn.yaml")
+def test_stream_with_client(client):
+    games = list(
+        client.stream_player_games_by_month_pgn(
+            username="fabianocaruana", year="2020", month="05"
+        )
+    )
+    validate_games(games)
+
+
+@pytest.mark.asyncio
+@vcr.use_cassette("get_player_games_by_month_pgn.yaml")
+async def test_stream_with_async_client(async_client):
+    games = [
+        game
+        async for game in async_client.stream_player_games_by_month_pgn(
+            username="fabianocaruana", year="2020", month="05"
+        )
+    ]
+    validate_games(games)
+
+
+def validate_games(games):
+    assert len(games) > 0
+    for game in games:
+        assert isinstance(game, PgnGame)
+        assert isinstance(game.headers["Link"], str)
+        assert game.movetext.startswith("1.")
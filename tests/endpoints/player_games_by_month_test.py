@@ -3,6 +3,7 @@ from unittest.mock import patch
 
 import pytest
 
+from chessdotcom import schemas
 from tests.vcr import vcr
 
 
@@ -31,6 +32,15 @@ async def test_with_async_client(async_client):
     validate_response(response)
 
 
+@vcr.use_cassette("get_player_games_by_month.yaml")
+def test_with_typed_client(typed_client):
+    response = typed_client.get_player_games_by_month(
+        username="fabianocaruana", year="2020", month="05"
+    )
+    validate_response(response)
+    assert all(isinstance(game, schemas.Game) for game in response.games)
+
+
 @vcr.use_cassette("get_player_games_by_month.yaml")
 @patch("chessdotcom.response_builder.Serializer.deserialize")
 def test_empty_data(deserialize, client):
@@ -42,6 +52,28 @@ def test_empty_data(deserialize, client):
     validate_response_structure(response)
 
 
+@vcr.use_cassette("get_player_games_by_month.yaml")
+def test_stream_with_client(client):
+    games = list(
+        client.stream_player_games_by_month(
+            username="fabianocaruana", year="2020", month="05"
+        )
+    )
+    validate_games(games)
+
+
+@pytest.mark.asyncio
+@vcr.use_cassette("get_player_games_by_month.yaml")
+async def test_stream_with_async_client(async_client):
+    games = [
+        game
+        async for game in async_client.stream_player_games_by_month(
+            username="fabianocaruana", year="2020", month="05"
+        )
+    ]
+    validate_games(games)
+
+
 def validate_response_structure(response):
     assert isinstance(response.json, dict)
     assert isinstance(response.text, str)
@@ -53,7 +85,10 @@ def validate_response(response):
 
     assert response.json.get("games") is not None
 
-    games = response.games
+    validate_games(response.games)
+
+
+def validate_games(games):
     assert len(games) > 0
     for game in games:
         assert isinstance(game.url, str)
@@ -3,6 +3,7 @@ from unittest.mock import patch
 
 import pytest
 
+from chessdotcom import schemas
 from chessdotcom.endpoints.team_match import TeamMatch
 from tests.vcr import vcr
 
@@ -26,6 +27,12 @@ async def test_with_async_client(async_client):
     validate_response(response)
 
 
+@vcr.use_cassette("get_team_match.yaml")
+def test_with_typed_client(typed_client):
+    response = typed_client.get_team_match(match_id=12803)
+    validate_response(response, match_type=schemas.TeamMatch)
+
+
 @vcr.use_cassette("get_team_match.yaml")
 @patch("chessdotcom.response_builder.Serializer.deserialize")
 def test_empty_data(deserialize, client):
@@ -35,14 +42,14 @@ def test_empty_data(deserialize, client):
     validate_response_structure(response)
 
 
-def validate_response_structure(response):
+def validate_response_structure(response, match_type=TeamMatch):
     assert isinstance(response.json, dict)
     assert isinstance(response.text, str)
-    assert isinstance(response.match, TeamMatch)
+    assert isinstance(response.match, match_type)
 
 
-def validate_response(response):
-    validate_response_structure(response)
+def validate_response(response, match_type=TeamMatch):
+    validate_response_structure(response, match_type)
 
     assert response.json.get("match") is not None
 
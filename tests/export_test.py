@@ -0,0 +1,56 @@
+import pytest
+
+from chessdotcom.endpoints.player_games_by_month import Accuracies
+from chessdotcom.export import games_to_columns, games_to_parquet, games_to_record_batch
+from tests.support.games import make_game
+
+
+@pytest.fixture
+def games():
+    return [
+        make_game("1"),
+        make_game("2", accuracies=Accuracies(white=98.1, black=90.5)),
+    ]
+
+
+def test_games_to_columns(games):
+    columns = games_to_columns(games)
+
+    assert columns["uuid"] == ["1", "2"]
+    assert columns["white_rating"] == [2800, 2800]
+    assert columns["black_username"] == ["fabianocaruana", "fabianocaruana"]
+    assert columns["accuracies_white"] == [None, 98.1]
+    assert columns["accuracies_black"] == [None, 90.5]
+    assert "white" not in columns and "accuracies" not in columns
+    assert all(len(column) == 2 for column in columns.values())
+
+    assert games_to_columns([]) == {}
+
+
+def test_games_to_arrow(games, tmp_path):
+    pyarrow = pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+
+    batch = games_to_record_batch(games)
+    assert batch.num_rows == 2
+    assert batch.column("white_rating").type == pyarrow.int64()
+    assert batch.column("accuracies_white").to_pylist() == [None, 98.1]
+
+    path = str(tmp_path / "games.parquet")
+    games_to_parquet(games, path)
+    assert parquet.read_table(path).column("uuid").to_pylist() == ["1", "2"]
+
+
+def test_games_to_columns_typed():
+    schemas = pytest.importorskip("chessdotcom.schemas")
+    archive = schemas.decode(
+        '{"games": [{"uuid": "1", "white": {"rating": 2800, "@id": "url"}}]}',
+        "GamesArchive",
+    )
+
+    columns = games_to_columns(archive.games)
+
+    assert columns["uuid"] == ["1"]
+    assert columns["white_rating"] == [2800]
+    assert columns["white_id"] == ["url"]
+    assert columns["accuracies_white"] == [None]
@@ -5,6 +5,11 @@ def test_available_imports():
     assert hasattr(chessdotcom, "ChessDotComClient")
     assert hasattr(chessdotcom, "Client")
     assert hasattr(chessdotcom, "RateLimitHandler")
+    assert hasattr(chessdotcom, "ConnectionConfig")
+    assert hasattr(chessdotcom, "RateLimiter")
+    assert hasattr(chessdotcom, "MemoryCache")
+    assert hasattr(chessdotcom, "SQLiteCache")
+    assert hasattr(chessdotcom, "FileCache")
 
     assert hasattr(chessdotcom, "get_club_details")
     assert hasattr(chessdotcom, "get_club_matches")
@@ -35,7 +40,11 @@ def test_available_imports():
     assert hasattr(chessdotcom, "get_tournament_details")
     assert hasattr(chessdotcom, "get_tournament_round")
     assert hasattr(chessdotcom, "get_tournament_round_group_details")
+    assert hasattr(chessdotcom, "stream_player_games_by_month")
+    assert hasattr(chessdotcom, "stream_player_games_by_month_pgn")
 
     assert hasattr(chessdotcom, "ChessDotComClientError")
     assert hasattr(chessdotcom, "ChessDotComError")
     assert hasattr(chessdotcom, "ChessDotComResponse")
+    assert hasattr(chessdotcom, "GameStore")
+    assert hasattr(chessdotcom, "sync_player")
@@ -0,0 +1,134 @@
+from unittest.mock import MagicMock
+
+from chessdotcom.pgn import (
+    ClockBatch,
+    PgnGame,
+    PgnStreamParser,
+    get_clocks,
+    get_clocks_batch,
+    get_tag,
+    get_tags,
+    get_tags_batch,
+    parse_pgn,
+)
+
+PGN = """[Event "Live Chess"]
+[White "Grischuk"]
+[Black "Fabiano \\"FC\\" Caruana"]
+[Result "1-0"]
+
+1. d4 {[%clk 0:02:59.9]} 1... Nf6 {[%clk 0:02:59.9]}
+2. Nf3 {[%clk 0:02:58.4]} 1-0
+
+
+[Event "Live Chess"]
+[White "FabianoCaruana"]
+[Black "Grischuk"]
+[Result "0-1"]
+
+1. e4 {A comment
+[spanning lines]} 1... e5 0-1
+"""
+
+
+def test_parse_pgn():
+    games = parse_pgn(PGN)
+
+    assert games == [
+        PgnGame(
+            headers={
+                "Event": "Live Chess",
+                "White": "Grischuk",
+                "Black": 'Fabiano "FC" Caruana',
+                "Result": "1-0",
+            },
+            movetext=(
+                "1. d4 {[%clk 0:02:59.9]} 1... Nf6 {[%clk 0:02:59.9]} "
+                "2. Nf3 {[%clk 0:02:58.4]} 1-0"
+            ),
+        ),
+        PgnGame(
+            headers={
+                "Event": "Live Chess",
+                "White": "FabianoCaruana",
+                "Black": "Grischuk",
+                "Result": "0-1",
+            },
+            movetext="1. e4 {A comment [spanning lines]} 1... e5 0-1",
+        ),
+    ]
+
+
+def test_stream_parser_chunks():
+    data = PGN.replace("Grischuk", "Грищук").encode()
+    parser = PgnStreamParser()
+
+    games = []
+    for i in range(0, len(data), 7):
+        games.extend(parser.feed(data[i : i + 7]))
+
+    assert len(games) == 1
+    games.extend(parser.close())
+
+    assert games == parse_pgn(PGN.replace("Grischuk", "Грищук"))
+    assert games[0].headers["White"] == "Грищук"
+
+
+def test_stream_parser_empty():
+    parser = PgnStreamParser()
+
+    assert parser.feed(b"") == []
+    assert parser.close() == []
+
+
+def test_get_tag():
+    first, second = PGN.split("\n\n\n")
+
+    assert get_tag(first, "White") == "Grischuk"
+    assert get_tag(first, "Black") == 'Fabiano "FC" Caruana'
+    assert get_tag(first, "Result") == "1-0"
+    assert get_tag(first, "ECO") is None
+    assert get_tag(second, "Result") == "0-1"
+    assert get_tag(second, "spanning") is None
+    assert get_tag("", "Event") is None
+    assert get_tag(None, "Event") is None
+    assert (
+        get_tag('[EventDate "2020.05.01"]\n[Event "Live Chess"]', "Event")
+        == "Live Chess"
+    )
+
+
+def test_get_tags():
+    first = PGN.split("\n\n\n")[0]
+
+    assert get_tags(first, ["White", "ECO"]) == {"White": "Grischuk", "ECO": None}
+
+
+def test_get_tags_batch():
+    first, second = PGN.split("\n\n\n")
+
+    assert get_tags_batch(
+        [first, MagicMock(pgn=second), MagicMock(pgn=None)], ["White"]
+    ) == {"White": ["Grischuk", "FabianoCaruana", None]}
+
+
+def test_get_clocks():
+    first = PGN.split("\n\n\n")[0]
+
+    assert get_clocks(first) == [179.9, 179.9, 178.4]
+    assert get_clocks("1. e4 {[%clk 1:00:05][%timestamp 10]} 1-0") == [3605.0]
+    assert get_clocks(None) == []
+
+
+def test_get_clocks_batch():
+    first, second = PGN.split("\n\n\n")
+
+    batch = get_clocks_batch([first, MagicMock(pgn=second), MagicMock(pgn=first)])
+
+    assert isinstance(batch, ClockBatch)
+    assert len(batch) == 3
+    assert batch.clocks.typecode == "f"
+    assert list(batch.offsets) == [0, 3, 3, 6]
+    assert batch.game(0) == batch.game(2)
+    assert list(batch.game(1)) == []
+    assert [round(clock, 1) for clock in batch.game(0)] == [179.9, 179.9, 178.4]
@@ -0,0 +1,72 @@
+import pytest
+
+from chessdotcom.errors import ChessDotComDecodingError
+from chessdotcom.response_builder import (
+    JsonArrayStreamParser,
+    Serializer,
+    _load_backend,
+)
+
+INSTALLED_BACKENDS = [name for name in Serializer.BACKENDS if _load_backend(name)]
+
+
+@pytest.mark.parametrize("backend", INSTALLED_BACKENDS)
+def test_serializer(backend):
+    serializer = Serializer(backend)
+
+    assert serializer.backend == backend
+    assert serializer.deserialize('{"username": "hikaru"}') == {"username": "hikaru"}
+    assert serializer.deserialize(b'{"games": [1, 2]}') == {"games": [1, 2]}
+
+    with pytest.raises(ChessDotComDecodingError) as err:
+        serializer.deserialize("<html>Not Found</html>")
+
+    assert err.value.text == "<html>Not Found</html>"
+
+
+def test_serializer_auto():
+    assert Serializer().backend == INSTALLED_BACKENDS[0]
+
+
+def test_serializer_unknown_backend():
+    with pytest.raises(ValueError):
+        Serializer("yaml")
+
+
+def test_decode_typed():
+    schemas = pytest.importorskip("chessdotcom.schemas")
+
+    archive = schemas.decode(
+        b'{"games": [{"end_time": 1588334136, "white": {"@id": "url"}}]}',
+        "GamesArchive",
+    )
+    assert archive.games[0].white.id == "url"
+    assert archive.games[0].end_datetime.year == 2020
+
+    with pytest.raises(ChessDotComDecodingError):
+        schemas.decode('{"games": [{"end_time": "soon"}]}', "GamesArchive")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024])
+def test_json_array_stream_parser(chunk_size):
+    content = '{"games": [{"pgn": "{]}", "moves": [1, 2]} , {"player": "Ł"}], "x": 1}'
+    content = content.encode()
+    parser = JsonArrayStreamParser("games", build_item=lambda item: sorted(item))
+
+    items = []
+    for start in range(0, len(content), chunk_size):
+        items += parser.feed(content[start : start + chunk_size])
+    items += parser.close()
+
+    assert items == [["moves", "pgn"], ["player"]]
+
+
+def test_json_array_stream_parser_incomplete():
+    parser = JsonArrayStreamParser("games")
+    assert parser.feed('{"games": [{"url": 1}, {"url"') == [{"url": 1}]
+
+    with pytest.raises(ChessDotComDecodingError):
+        parser.close()
+
+    parser = JsonArrayStreamParser("games")
+    assert parser.feed("{}") + parser.close() == []
@@ -0,0 +1,120 @@
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from chessdotcom.endpoints.player_games_by_month import Accuracies
+from chessdotcom.store import GameStore, sync_player
+from tests.support.games import make_game
+
+
+def test_game_store():
+    games = [
+        make_game("1", 1588334136, accuracies=Accuracies(white=98.1, black=90.5)),
+        make_game("2", 1588420536, time_class="bullet", eco_code="C50"),
+        make_game("3", 1593604536, white="MagnusCarlsen", black="Hikaru"),
+    ]
+
+    with GameStore() as store:
+        assert store.add_games(games) == 3
+        assert store.add_games(games[:2]) == 0
+        assert store.count() == 3
+
+        assert store.query() == games
+        assert [g.uuid for g in store.query(username="HIKARU")] == ["1", "2", "3"]
+        assert [g.uuid for g in store.query(username="magnuscarlsen")] == ["3"]
+        assert [g.uuid for g in store.query(time_class="blitz")] == ["1", "3"]
+        assert [g.uuid for g in store.query(eco="C50")] == ["2"]
+        assert [g.uuid for g in store.query(rules="crazyhouse")] == []
+        assert [
+            g.uuid
+            for g in store.query(
+                username="hikaru",
+                since=datetime(2020, 5, 2),
+                until=datetime(2020, 6, 1),
+            )
+        ] == ["2"]
+        assert [g.uuid for g in store.query(limit=1)] == ["1"]
+
+
+def test_game_store_persists(tmp_path):
+    path = str(tmp_path / "games.sqlite")
+
+    with GameStore(path) as store:
+        store.add_games([make_game("1", 1588334136)])
+
+    with GameStore(path) as store:
+        assert [g.uuid for g in store.query()] == ["1"]
+
+
+def test_sync_player():
+    current_month = f"{datetime.utcnow():%Y/%m}"
+    archives = [
+        "https://api.chess.com/pub/player/hikaru/games/2020/05",
+        "https://api.chess.com/pub/player/hikaru/games/2020/06",
+    ]
+    games = {
+        "2020/05": [make_game("1", 1588334136)],
+        "2020/06": [make_game("2", 1591012536)],
+        current_month: [make_game("3", 1600000000)],
+    }
+    client = MagicMock()
+    client.get_player_game_archives.side_effect = lambda username: MagicMock(
+        archives=archives
+    )
+    client.get_player_games_by_month.side_effect = lambda username, year, month: (
+        MagicMock(games=games[f"{year}/{month}"])
+    )
+
+    with GameStore() as store:
+        assert store.get_watermark("hikaru") == (None, None)
+
+        assert sync_player("hikaru", store, client=client) == 2
+        assert store.get_watermark("hikaru") == ("2020/06", 1591012536)
+
+        archives.append(
+            f"https://api.chess.com/pub/player/hikaru/games/{current_month}"
+        )
+        assert store.sync(client, "hikaru") == 1
+        assert store.get_watermark("hikaru") == ("2020/06", 1600000000)
+
+        games[current_month].append(make_game("4", 1600000500))
+        assert sync_player("hikaru", store, client=client) == 1
+
+        fetched = [
+            f"{call.kwargs['year']}/{call.kwargs['month']}"
+            for call in client.get_player_games_by_month.call_args_list
+        ]
+        assert fetched == ["2020/05", "2020/06", current_month, current_month]
+        assert [g.uuid for g in store.query(username="hikaru")] == ["1", "2", "3", "4"]
+
+
+@patch("chessdotcom.store.is_month_completed")
+def test_sync_player_late_games(is_month_completed_mock):
+    archives = [
+        "https://api.chess.com/pub/player/hikaru/games/2020/05",
+        "https://api.chess.com/pub/player/hikaru/games/2020/06",
+    ]
+    games = {
+        "2020/05": [make_game("1", 1590000000)],
+        "2020/06": [make_game("2", 1591000000)],
+    }
+    client = MagicMock()
+    client.get_player_game_archives.side_effect = lambda username: MagicMock(
+        archives=archives
+    )
+    client.get_player_games_by_month.side_effect = lambda username, year, month: (
+        MagicMock(games=games[f"{year}/{month}"])
+    )
+
+    with GameStore() as store:
+        # 2020/05 is still in its grace period
+        is_month_completed_mock.return_value = False
+        assert sync_player("hikaru", store, client=client) == 2
+        assert store.get_watermark("hikaru") == (None, 1591000000)
+
+        # a game ending on 2020/05/31 23:50 is added to the archive late
+        games["2020/05"].append(make_game("3", 1590969000))
+        is_month_completed_mock.side_effect = lambda year, month: month == "05"
+        assert sync_player("hikaru", store, client=client) == 1
+        assert store.get_watermark("hikaru") == ("2020/05", 1591000000)
+
+        assert [g.uuid for g in store.query()] == ["1", "3", "2"]
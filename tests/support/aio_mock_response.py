@@ -10,6 +10,9 @@ class AioMockResponse:
     async def text(self):
         return self._text
 
+    async def read(self):
+        return self._text.encode()
+
     async def __aexit__(self, exc_type, exc, tb):
         pass
 
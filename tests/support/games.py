@@ -0,0 +1,34 @@
+from chessdotcom.endpoints.player_games_by_month import Game, PlayerStats
+
+
+def make_game(
+    uuid,
+    end_time=1588334136,
+    white="hikaru",
+    black="fabianocaruana",
+    eco_code="B20",
+    **kwargs,
+):
+    game = dict(
+        url=f"https://www.chess.com/game/live/{uuid}",
+        pgn=f'[Event "Live Chess"]\n[ECO "{eco_code}"]\n\n1. e4 c5',
+        time_control="180",
+        start_time=None,
+        end_time=end_time,
+        accuracies=None,
+        tcn="mC0K",
+        uuid=uuid,
+        initial_setup=None,
+        fen=None,
+        time_class="blitz",
+        rules="chess",
+        eco="https://www.chess.com/openings/Sicilian-Defense",
+        white=PlayerStats(
+            rating=2800, result="win", username=white, id=None, uuid=None
+        ),
+        black=PlayerStats(
+            rating=2750, result="resigned", username=black, id=None, uuid=None
+        ),
+    )
+    game.update(kwargs)
+    return Game(**game)
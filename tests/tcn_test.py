@@ -0,0 +1,45 @@
+from array import array
+
+import pytest
+
+from chessdotcom.tcn import TcnMove, decode_tcn, decode_tcn_batch, square_name
+
+
+def test_square_name():
+    assert square_name(0) == "a1"
+    assert square_name(28) == "e4"
+    assert square_name(63) == "h8"
+
+
+def test_decode_tcn():
+    moves = decode_tcn("mC0Kgv")
+
+    assert moves == [TcnMove(12, 28), TcnMove(52, 36), TcnMove(6, 21)]
+    assert [move.uci for move in moves] == ["e2e4", "e7e5", "g1f3"]
+
+
+def test_decode_tcn_promotions_and_drops():
+    moves = decode_tcn("0~m(-v")
+
+    assert [move.uci for move in moves] == ["e7e8q", "e2d1n", "N@f3"]
+    assert moves[0].promotion == "q"
+    assert moves[2] == TcnMove(None, 21, drop="n")
+
+
+def test_decode_tcn_batch():
+    batch = decode_tcn_batch(["mC0K", None, "0~"])
+
+    assert len(batch) == 3
+    assert batch.offsets == array("I", [0, 2, 2, 3])
+    assert batch.from_squares == array("B", [12, 52, 52])
+    assert batch.to_squares == array("B", [28, 36, 60])
+    assert batch.promotions == array("B", [0, 0, 1])
+    assert batch.drops == array("B", [0, 0, 0])
+    assert batch.moves(1) == []
+    assert [move.uci for move in batch.moves(2)] == ["e7e8q"]
+
+
+@pytest.mark.parametrize("tcn", ["mC0", "mC 0", "mCé0", ",m"])
+def test_decode_tcn_malformed(tcn):
+    with pytest.raises(ValueError):
+        decode_tcn(tcn)
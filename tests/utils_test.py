@@ -1,6 +1,15 @@
+from dataclasses import dataclass
 from datetime import datetime
 
-from chessdotcom.utils import dig, resolve_date
+import pytest
+
+from chessdotcom.utils import (
+    dig,
+    is_month_completed,
+    parse_archive_url,
+    resolve_date,
+    slotted,
+)
 
 
 def test_resolve_date():
@@ -39,3 +48,47 @@ def test_dig():
         )
         is None
     )
+
+
+def test_parse_archive_url():
+    assert parse_archive_url(
+        "https://api.chess.com/pub/player/fabianocaruana/games/2020/05"
+    ) == ("2020", "05")
+    assert parse_archive_url("/player/fabianocaruana/games/2020/5/") == ("2020", "05")
+
+    with pytest.raises(ValueError):
+        parse_archive_url("https://api.chess.com/pub/player/fabianocaruana")
+
+
+def test_is_month_completed():
+    now = datetime(2024, 3, 15)
+
+    assert is_month_completed("2024", "01", now=now) is True
+    assert is_month_completed("2023", "12", now=now) is True
+    assert is_month_completed("2024", "03", now=now) is False
+    assert is_month_completed("2024", "04", now=now) is False
+
+    assert is_month_completed("2024", "02", now=datetime(2024, 3, 1, 12)) is False
+    assert is_month_completed("2024", "02", now=datetime(2024, 3, 2)) is True
+    assert is_month_completed("2023", "12", now=datetime(2024, 1, 2)) is True
+
+
+def test_slotted():
+    @slotted("double")
+    @dataclass(repr=True)
+    class Model(object):
+        value: int
+
+        def __post_init__(self):
+            self.double = self.value * 2
+
+    model = Model(value=2)
+
+    assert model.double == 4
+    assert model == Model(value=2)
+    assert repr(model) == "Model(value=2)"
+    assert Model.__slots__ == ("value", "double")
+    assert not hasattr(model, "__dict__")
+
+    with pytest.raises(AttributeError):
+        model.other = 1